@@ -2,7 +2,12 @@
 Chrome Helper - Utility functions for setting up Chrome WebDriver
 """
 
+import io
 import os
+import json
+import functools
+import contextlib
+import hashlib
 import sys
 import logging
 import zipfile
@@ -11,39 +16,470 @@ import requests
 import subprocess
 import platform
 import time
+import threading
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import ijson  # Optional: streams the CfT version list instead of loading it whole
+except ImportError:
+    ijson = None
 
 logger = logging.getLogger(__name__)
 
+# Transport-level retries for transient HTTP failures (5xx, 429, resets)
+DOWNLOAD_RETRY = Retry(
+    total=5,
+    backoff_factor=0.5,
+    status_forcelist=[429, 500, 502, 503, 504],
+    allowed_methods=["GET", "HEAD"],
+)
+
+DRIVER_DIR = Path.home() / "ringba_chromedriver"
+
+# Seconds after which another process' download lock is considered stale
+DOWNLOAD_LOCK_TIMEOUT = 300
+
+# Buffer size for driver file I/O, large enough for few, big write() calls
+COPY_BUFFER_SIZE = 1024 * 1024
+
+# Registry locations holding the installed Chrome version, checked in order
+CHROME_REGISTRY_KEYS = (
+    ("HKEY_CURRENT_USER", r"Software\Google\Chrome\BLBeacon", "version"),
+    ("HKEY_LOCAL_MACHINE", r"Software\Google\Chrome\BLBeacon", "version"),
+    ("HKEY_LOCAL_MACHINE", r"Software\Wow6432Node\Google\Chrome\BLBeacon", "version"),
+    ("HKEY_LOCAL_MACHINE", r"SOFTWARE\Microsoft\Windows\CurrentVersion\Uninstall\Google Chrome", "DisplayVersion"),
+)
+
+# How long a detected Chrome version is trusted before re-querying the system
+CHROME_VERSION_TTL = 3600
+
+# How long a resolved driver version/URL is reused before asking the CDN again
+RESOLVE_CACHE_TTL = 3600
+
+# Hosts serving the legacy (<115) ChromeDriver layout, tried in order
+CHROMEDRIVER_MIRRORS = [
+    "https://chromedriver.storage.googleapis.com",
+    "https://npm.taobao.org/mirrors/chromedriver",
+    "https://registry.npmmirror.com/-/binary/chromedriver",
+]
+
+CFT_BASE_URL = "https://googlechromelabs.github.io/chrome-for-testing"
+
+# Hosts serving Chrome-for-Testing (>=115) builds, tried after the published URL
+CFT_MIRRORS = [
+    "https://storage.googleapis.com/chrome-for-testing-public",
+    "https://edgedl.me.gvt1.com/edgedl/chrome/chrome-for-testing",
+]
+
+# Driver versions used when no lookup succeeds; never cached, so the next run asks again
+CFT_FALLBACK_VERSION = "115.0.5790.170"
+LEGACY_FALLBACK_VERSION = "114.0.5735.90"
+
+def _fetch_zip(session, urls, buf):
+    """
+    Download the first reachable URL in urls into the file-like object buf
+    
+    Transient failures are retried by the session's DOWNLOAD_RETRY adapter;
+    once those are exhausted, or on a 403/404, the next mirror is tried.
+    """
+    last_exception = None
+    for url in urls:
+        logger.info(f"Downloading from: {url}")
+        try:
+            with session.get(url, stream=True, timeout=(5, 60)) as response:
+                response.raise_for_status()
+                response.raw.decode_content = True
+                buf.seek(0)
+                buf.truncate()
+                for chunk in response.iter_content(chunk_size=64 * 1024):
+                    buf.write(chunk)
+            buf.seek(0)
+            return url
+        except requests.RequestException as e:
+            last_exception = e
+            logger.warning(f"Download from {url} failed: {e}, trying next mirror")
+    raise last_exception or Exception("No ChromeDriver download URL available")
+
+# Static Chrome arguments, built once at import time
+HEADLESS_ARG = "--headless=new"  # Use the newer headless mode
+CHROME_ARGS = (
+    # Essential options
+    "--no-sandbox",
+    "--disable-dev-shm-usage",
+    "--disable-gpu",
+    "--window-size=1920,1080",
+    
+    # Additional options to improve reliability
+    "--disable-extensions",
+    "--disable-infobars",
+    "--ignore-certificate-errors",
+    "--allow-insecure-localhost",
+    "--disable-web-security",
+    "--remote-debugging-port=0",  # Enable debugging on a free port so instances don't collide
+    "--disable-blink-features=AutomationControlled",  # Hide automation
+    
+    # Add options to fix TensorFlow Lite dynamic tensor issues
+    "--disable-features=BlinkGenPropertyTrees",
+    "--force-device-scale-factor=1",
+    
+    # Skip image decoding; only the report text is read
+    "--blink-settings=imagesEnabled=false",
+)
+# Fallback set used when a launch with CHROME_ARGS fails
+MINIMAL_HEADLESS_ARG = "--headless"
+MINIMAL_CHROME_ARGS = (
+    "--no-sandbox",
+    "--disable-dev-shm-usage",
+)
+CHROME_EXPERIMENTAL_OPTIONS = (
+    ("excludeSwitches", ["enable-automation"]),
+    ("useAutomationExtension", False),
+    # Don't even fetch images
+    ("prefs", {"profile.managed_default_content_settings.images": 2}),
+)
+
+def _make_session():
+    """
+    Create a requests Session that retries transient failures with backoff
+    and keeps connections alive for reuse
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=DOWNLOAD_RETRY)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+# Shared session so metadata and zip requests to the same host reuse connections
+_SESSION = _make_session()
+
+# Last successfully detected Chrome version as (detected at, version); failures are never kept
+_CHROME_VERSION_MEMO = None
+
 def get_chrome_version():
     """
     Get the installed Chrome version on Windows
+    
+    A detected version is reused in-process and cached on disk for CHROME_VERSION_TTL
+    seconds so repeated driver setups don't re-query the registry/PowerShell. Once the
+    TTL passes it is detected again, so a long-running process notices a Chrome update.
+    """
+    global _CHROME_VERSION_MEMO
+    now = time.time()
+    if _CHROME_VERSION_MEMO and now - _CHROME_VERSION_MEMO[0] < CHROME_VERSION_TTL:
+        return _CHROME_VERSION_MEMO[1]
+    
+    cache_path = DRIVER_DIR / "chrome_version.json"
+    cached = _load_cache(cache_path)
+    if cached.get("version") and now - cached.get("ts", 0) < CHROME_VERSION_TTL:
+        _CHROME_VERSION_MEMO = (cached["ts"], cached["version"])
+        return cached["version"]
+    
+    version = _detect_chrome_version()
+    if version:
+        os.makedirs(DRIVER_DIR, exist_ok=True)
+        _save_cache(cache_path, {"version": version, "ts": now})
+        _CHROME_VERSION_MEMO = (now, version)
+    return version
+
+def _try_registry(hive, path, value_name="version"):
+    """
+    Read a single registry value
+    
+    Returns:
+        str: The value, or None if the key/value is missing or winreg is unavailable
     """
     try:
-        # Method 1: Try using registry
         import winreg
-        key = winreg.OpenKey(winreg.HKEY_CURRENT_USER, r"Software\Google\Chrome\BLBeacon")
-        version, _ = winreg.QueryValueEx(key, "version")
-        return version
-    except:
-        # Method 2: Try using PowerShell
+    except ImportError:
+        return None
+    try:
+        with winreg.OpenKey(getattr(winreg, hive), path) as key:
+            value, _ = winreg.QueryValueEx(key, value_name)
+            return value
+    except OSError:
+        return None
+
+def _try_powershell(exe_path):
+    """
+    Ask PowerShell for an executable's FileVersion
+    
+    Returns:
+        str: The version, or None if PowerShell is unavailable or the file is missing
+    """
+    try:
+        result = subprocess.check_output(
+            ['powershell', '-command', 
+             f'(Get-Item -Path "{exe_path}").VersionInfo.FileVersion;'],
+            stderr=subprocess.STDOUT)
+        return result.decode('utf-8').strip() or None
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def _detect_chrome_version():
+    """
+    Query the registry (or PowerShell as a last resort) for the Chrome version
+    """
+    # Method 1: Registry, per-user install first, then machine-wide
+    for hive, path, value_name in CHROME_REGISTRY_KEYS:
+        version = _try_registry(hive, path, value_name)
+        if version:
+            return version
+    
+    # Method 2: Read the chrome.exe version resource in-process
+    for env_var in ("PROGRAMFILES", "PROGRAMFILES(X86)", "LOCALAPPDATA"):
+        base = os.environ.get(env_var)
+        if not base:
+            continue
+        version = _file_version(os.path.join(base, "Google", "Chrome", "Application", "chrome.exe"))
+        if version:
+            return version
+    
+    # Method 3: PowerShell, for 64-bit then 32-bit Chrome
+    for exe_path in (r"$env:PROGRAMFILES\Google\Chrome\Application\chrome.exe",
+                     r"${env:PROGRAMFILES(x86)}\Google\Chrome\Application\chrome.exe"):
+        version = _try_powershell(exe_path)
+        if version:
+            return version
+    
+    # Cannot determine Chrome version
+    return None
+
+def _file_version(path):
+    """
+    Read the FileVersion of a Windows executable via Version.dll, without spawning a process
+    
+    Returns:
+        str: Version like "120.0.6099.109", or None if unavailable
+    """
+    if not os.path.isfile(path):
+        return None
+    try:
+        import ctypes
+        version_dll = ctypes.windll.version
+        size = version_dll.GetFileVersionInfoSizeW(path, None)
+        if not size:
+            return None
+        info = ctypes.create_string_buffer(size)
+        if not version_dll.GetFileVersionInfoW(path, 0, size, info):
+            return None
+        fixed = ctypes.c_void_p()
+        fixed_len = ctypes.c_uint()
+        if not version_dll.VerQueryValueW(info, "\\", ctypes.byref(fixed), ctypes.byref(fixed_len)):
+            return None
+        # VS_FIXEDFILEINFO: dwSignature, dwStrucVersion, dwFileVersionMS, dwFileVersionLS, ...
+        fields = ctypes.cast(fixed, ctypes.POINTER(ctypes.c_uint32 * 4)).contents
+        ms, ls = fields[2], fields[3]
+        return f"{ms >> 16}.{ms & 0xFFFF}.{ls >> 16}.{ls & 0xFFFF}"
+    except (AttributeError, OSError):
+        return None
+
+def _latest_cft_release(session, chrome_major):
+    """
+    Look up the newest Chrome-for-Testing driver version for a major version
+    
+    Returns:
+        tuple: (driver_version, []) - URLs are derived from CFT_MIRRORS by the caller
+    """
+    response = session.get(f"{CFT_BASE_URL}/LATEST_RELEASE_{chrome_major}", timeout=(5, 30))
+    response.raise_for_status()
+    return response.text.strip() or None, []
+
+def _known_good_release(session, chrome_major):
+    """
+    Scan known-good-versions-with-downloads.json for a major version
+    
+    Returns:
+        tuple: (driver_version, published win32 download URLs), or (None, []) if absent
+    """
+    prefix = f"{chrome_major}."
+    url = f"{CFT_BASE_URL}/known-good-versions-with-downloads.json"
+    latest_version = None
+    
+    if ijson is not None:
+        # Stream-parse the (multi-MB) version list, keeping only the newest match
+        with session.get(url, stream=True, timeout=(5, 60)) as response:
+            response.raise_for_status()
+            response.raw.decode_content = True
+            for version_data in ijson.items(response.raw, "versions.item"):
+                if version_data["version"].startswith(prefix):
+                    latest_version = version_data
+    else:
+        # Get available Chrome versions
+        response = session.get(url, timeout=(5, 60))
+        response.raise_for_status()
+        data = response.json()
+        
+        # Use the latest patch version for this major version
+        for version_data in data["versions"]:
+            if version_data["version"].startswith(prefix):
+                latest_version = version_data
+    
+    if not latest_version:
+        return None, []
+    
+    # Find the chromedriver download for win32
+    download_urls = [
+        download["url"]
+        for download in latest_version["downloads"].get("chromedriver", [])
+        if download["platform"] == "win32"
+    ]
+    return latest_version["version"], download_urls
+
+def _resolve_download_urls(session, chrome_major):
+    """
+    Resolve the ChromeDriver version for a Chrome major version
+    
+    Returns:
+        tuple: (driver_version, list of candidate download URLs in priority order)
+    """
+    # For Chrome >= 115, use the new API
+    if chrome_major != "latest" and int(chrome_major) >= 115:
+        # The LATEST_RELEASE_<major> endpoint returns just the version string;
+        # only scan the multi-MB known-good list if it has nothing for us
+        driver_version, download_urls = None, []
+        try:
+            driver_version, download_urls = _latest_cft_release(session, chrome_major)
+        except requests.RequestException as e:
+            logger.warning(f"LATEST_RELEASE_{chrome_major} lookup failed: {e}")
+        
+        if not driver_version:
+            try:
+                driver_version, download_urls = _known_good_release(session, chrome_major)
+            except (requests.RequestException, ValueError) as e:
+                logger.warning(f"Known-good versions lookup failed: {e}")
+        
+        if not driver_version:
+            logger.warning(f"No matching version found for Chrome {chrome_major}, using latest")
+            driver_version = CFT_FALLBACK_VERSION
+            download_urls = []
+        
+        logger.info(f"Using ChromeDriver version: {driver_version}")
+        
+        # Secondary Chrome-for-Testing hosts in case the published URL is refused
+        for host in CFT_MIRRORS:
+            url = f"{host}/{driver_version}/win32/chromedriver-win32.zip"
+            if url not in download_urls:
+                download_urls.append(url)
+    else:
+        # For older Chrome versions or "latest"
+        release_file = "LATEST_RELEASE" if chrome_major == "latest" else f"LATEST_RELEASE_{chrome_major}"
+        
+        driver_version = None
+        for host in CHROMEDRIVER_MIRRORS:
+            try:
+                response = session.get(f"{host}/{release_file}", timeout=(5, 30))
+                response.raise_for_status()
+                driver_version = response.text.strip()
+                break
+            except requests.RequestException as e:
+                logger.warning(f"Could not resolve {release_file} from {host}: {e}")
+        
+        if not driver_version:
+            # Fallback to a known working version
+            driver_version = LEGACY_FALLBACK_VERSION
+        
+        download_urls = [f"{host}/{driver_version}/chromedriver_win32.zip" for host in CHROMEDRIVER_MIRRORS]
+    
+    return driver_version, download_urls
+
+def _load_cache(cache_path):
+    """
+    Load a JSON cache file, returning an empty dict if it is missing or unreadable
+    """
+    try:
+        with open(cache_path, "r") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def _save_cache(cache_path, data):
+    """
+    Write a JSON cache file, ignoring failures since the cache is only an optimization
+    """
+    try:
+        with open(cache_path, "w") as f:
+            json.dump(data, f)
+    except OSError as e:
+        logger.warning(f"Could not write cache {cache_path}: {e}")
+
+def _sha256(path):
+    """
+    Compute the SHA-256 hex digest of a file
+    """
+    digest = hashlib.sha256()
+    with open(path, "rb", buffering=COPY_BUFFER_SIZE) as f:
+        for chunk in iter(lambda: f.read(COPY_BUFFER_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def _verify_checksum(driver_path, checksum_path):
+    """
+    Check a driver against the checksum recorded when it was downloaded
+    
+    Returns:
+        bool: True if the recorded checksum exists and matches
+    """
+    try:
+        with open(checksum_path, "r") as f:
+            expected = f.read().strip()
+        return bool(expected) and _sha256(driver_path) == expected
+    except OSError:
+        return False
+
+@contextlib.contextmanager
+def _file_lock(lock_path, timeout=DOWNLOAD_LOCK_TIMEOUT, poll_interval=0.5):
+    """
+    Hold an exclusive, cross-process lock file for the duration of the block
+    
+    A lock file older than timeout is assumed to belong to a crashed process
+    and is removed. While the lock is held its mtime is refreshed every
+    timeout / 3 seconds, so a slow download is never mistaken for a stale lock.
+    """
+    token = f"{os.getpid()}-{time.time_ns()}".encode()
+    while True:
         try:
-            result = subprocess.check_output(
-                ['powershell', '-command', 
-                 r'(Get-Item -Path "$env:PROGRAMFILES\Google\Chrome\Application\chrome.exe").VersionInfo.FileVersion;'],
-                stderr=subprocess.STDOUT)
-            return result.decode('utf-8').strip()
-        except:
-            # Method 3: Try using direct path for 32-bit Chrome
+            fd = os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+            break
+        except FileExistsError:
+            try:
+                if time.time() - os.path.getmtime(lock_path) > timeout:
+                    logger.warning(f"Removing stale lock {lock_path}")
+                    os.remove(lock_path)
+                    continue
+            except OSError:
+                # Lock was released between the open and the stat, retry right away
+                continue
+            time.sleep(poll_interval)
+    
+    stop = threading.Event()
+    
+    def heartbeat():
+        while not stop.wait(timeout / 3):
             try:
-                result = subprocess.check_output(
-                    ['powershell', '-command', 
-                     r'(Get-Item -Path "$env:PROGRAMFILES(x86)\Google\Chrome\Application\chrome.exe").VersionInfo.FileVersion;'],
-                    stderr=subprocess.STDOUT)
-                return result.decode('utf-8').strip()
-            except:
-                # Cannot determine Chrome version
-                return None
+                os.utime(lock_path)
+            except OSError:
+                return
+    
+    try:
+        os.write(fd, token)
+    finally:
+        os.close(fd)
+    
+    try:
+        threading.Thread(target=heartbeat, name="chromedriver-lock-heartbeat", daemon=True).start()
+        yield
+    finally:
+        stop.set()
+        # Only remove the lock if it is still ours; never delete another process' lock
+        try:
+            with open(lock_path, "rb") as f:
+                if f.read() == token:
+                    os.remove(lock_path)
+        except OSError:
+            pass
 
 def download_chromedriver(chrome_version=None, force=False):
     """
@@ -56,7 +492,7 @@ def download_chromedriver(chrome_version=None, force=False):
     Returns:
         str: Path to the ChromeDriver executable
     """
-    driver_dir = Path.home() / "ringba_chromedriver"
+    driver_dir = DRIVER_DIR
     os.makedirs(driver_dir, exist_ok=True)
     
     # Get major Chrome version (e.g., "94" from "94.0.4606.81")
@@ -71,99 +507,80 @@ def download_chromedriver(chrome_version=None, force=False):
     
     logger.info(f"Chrome version: {chrome_version}, Major version: {chrome_major}")
     
-    # Check if we already have the correct driver
     driver_path = driver_dir / f"chromedriver_{chrome_major}.exe"
     
+    # Serialize installs across processes; a process that waited on the lock
+    # re-checks below and reuses the driver the other one just downloaded
+    with _file_lock(driver_dir / "download.lock"):
+        return _install_chromedriver(driver_dir, driver_path, chrome_major, force)
+
+def _install_chromedriver(driver_dir, driver_path, chrome_major, force):
+    """
+    Reuse or download the driver for chrome_major; must be called under the download lock
+    
+    Returns:
+        str: Path to the ChromeDriver executable
+    """
+    # Check if we already have the correct driver
+    checksum_path = driver_path.with_suffix(".sha256")
+    
     if not force and driver_path.exists():
-        logger.info(f"ChromeDriver for Chrome {chrome_major} already exists at {driver_path}")
-        return str(driver_path)
+        if _verify_checksum(driver_path, checksum_path):
+            logger.info(f"ChromeDriver for Chrome {chrome_major} already exists at {driver_path}")
+            return str(driver_path)
+        logger.warning(f"ChromeDriver at {driver_path} failed checksum verification, re-downloading")
     
     # Determine download URL based on version
     logger.info("Downloading ChromeDriver...")
+    session = _SESSION
     
     try:
-        # For Chrome >= 115, use the new API
-        if chrome_major != "latest" and int(chrome_major) >= 115:
-            # Get available Chrome versions
-            response = requests.get("https://googlechromelabs.github.io/chrome-for-testing/known-good-versions-with-downloads.json")
-            data = response.json()
-            
-            # Find the closest matching version
-            available_versions = []
-            for version_data in data["versions"]:
-                if version_data["version"].startswith(f"{chrome_major}."):
-                    available_versions.append(version_data)
-            
-            if not available_versions:
-                logger.warning(f"No matching version found for Chrome {chrome_major}, using latest")
-                download_url = f"https://edgedl.me.gvt1.com/edgedl/chrome/chrome-for-testing/115.0.5790.170/win32/chromedriver-win32.zip"
-            else:
-                # Use the latest patch version for this major version
-                latest_version = available_versions[-1]
-                download_url = None
-                
-                # Find the chromedriver download for win32
-                for download in latest_version["downloads"].get("chromedriver", []):
-                    if download["platform"] == "win32":
-                        download_url = download["url"]
-                
-                if not download_url:
-                    download_url = f"https://edgedl.me.gvt1.com/edgedl/chrome/chrome-for-testing/{latest_version['version']}/win32/chromedriver-win32.zip"
-                
-                logger.info(f"Using ChromeDriver version: {latest_version['version']}")
-        else:
-            # For older Chrome versions or "latest"
-            download_url = f"https://chromedriver.storage.googleapis.com/LATEST_RELEASE_{chrome_major}"
-            if chrome_major == "latest":
-                download_url = "https://chromedriver.storage.googleapis.com/LATEST_RELEASE"
-            
-            try:
-                response = requests.get(download_url)
-                driver_version = response.text.strip()
-                download_url = f"https://chromedriver.storage.googleapis.com/{driver_version}/chromedriver_win32.zip"
-            except:
-                # Fallback to a known working version
-                download_url = "https://chromedriver.storage.googleapis.com/114.0.5735.90/chromedriver_win32.zip"
-                
-        # Download the driver
-        logger.info(f"Downloading from: {download_url}")
-        response = requests.get(download_url)
-        
-        # Save the zip file
-        zip_path = driver_dir / "chromedriver_temp.zip"
-        with open(zip_path, "wb") as f:
-            f.write(response.content)
+        cache_path = driver_dir / "resolved.json"
+        cache = _load_cache(cache_path)
+        entry = cache.get(chrome_major)
         
-        # Extract the zip
-        with zipfile.ZipFile(zip_path, "r") as zip_ref:
-            # Extract to a temp directory
-            temp_dir = driver_dir / "temp_extract"
-            if temp_dir.exists():
-                shutil.rmtree(temp_dir)
-            os.makedirs(temp_dir, exist_ok=True)
-            zip_ref.extractall(temp_dir)
+        # Download the driver into memory; the zip never touches disk
+        zip_buffer = io.BytesIO()
         
-        # Find the chromedriver.exe in the extracted folder (handle different zip structures)
-        chromedriver_exe = None
-        for root, dirs, files in os.walk(temp_dir):
-            for file in files:
-                if file.lower() == "chromedriver.exe":
-                    chromedriver_exe = Path(root) / file
-                    break
-            if chromedriver_exe:
-                break
+        download_url = None
+        if entry and entry.get("urls") and time.time() - entry.get("ts", 0) < RESOLVE_CACHE_TTL:
+            # Reuse a recent lookup (with its full mirror list) instead of hitting the version endpoints again
+            driver_version = entry["version"]
+            logger.info(f"Using cached ChromeDriver version: {driver_version}")
+            try:
+                download_url = _fetch_zip(session, entry["urls"], zip_buffer)
+            except Exception as e:
+                logger.warning(f"Cached ChromeDriver download failed: {e}, resolving again")
         
-        if not chromedriver_exe:
-            raise Exception("Could not find chromedriver.exe in the downloaded zip")
+        if download_url is None:
+            driver_version, download_urls = _resolve_download_urls(session, chrome_major)
+            download_url = _fetch_zip(session, download_urls, zip_buffer)
+            
+            # Cache the version and every candidate URL, but never a hard-coded fallback
+            if driver_version not in (CFT_FALLBACK_VERSION, LEGACY_FALLBACK_VERSION):
+                cache[chrome_major] = {"version": driver_version, "urls": download_urls, "ts": time.time()}
+                _save_cache(cache_path, cache)
         
-        # Copy to the final location
-        shutil.copy2(chromedriver_exe, driver_path)
+        # Extract only chromedriver.exe, located via the zip's central directory
+        # (handles both the legacy flat layout and the CfT chromedriver-win32/ folder)
+        with zipfile.ZipFile(zip_buffer, "r") as zip_ref:
+            member = next(
+                (name for name in zip_ref.namelist() if name.lower().endswith("chromedriver.exe")),
+                None,
+            )
+            if not member:
+                raise Exception("Could not find chromedriver.exe in the downloaded zip")
+            
+            # Write next to the final path and rename into place, so a crash
+            # mid-write never leaves a truncated driver at driver_path
+            tmp_path = driver_path.with_name(driver_path.name + ".tmp")
+            with zip_ref.open(member) as src, open(tmp_path, "wb", buffering=COPY_BUFFER_SIZE) as dst:
+                shutil.copyfileobj(src, dst, COPY_BUFFER_SIZE)
+            os.replace(tmp_path, driver_path)
         
-        # Cleanup
-        if zip_path.exists():
-            os.remove(zip_path)
-        if temp_dir.exists():
-            shutil.rmtree(temp_dir)
+        # Record the checksum so later runs can detect a corrupted driver
+        with open(checksum_path, "w") as f:
+            f.write(_sha256(driver_path))
         
         logger.info(f"ChromeDriver downloaded and saved to {driver_path}")
         return str(driver_path)
@@ -172,6 +589,37 @@ def download_chromedriver(chrome_version=None, force=False):
         logger.error(f"Error downloading ChromeDriver: {e}")
         raise
 
+@functools.lru_cache(maxsize=None)
+def _options_args(headless, minimal=False):
+    """
+    Return the Chrome argument tuple for a headless/minimal combination
+    """
+    if minimal:
+        args = MINIMAL_CHROME_ARGS
+        return (MINIMAL_HEADLESS_ARG,) + args if headless else args
+    return (HEADLESS_ARG,) + CHROME_ARGS if headless else CHROME_ARGS
+
+def _build_options(headless, minimal=False):
+    """
+    Build a fresh selenium Options object from the cached argument set
+    
+    Args:
+        headless (bool): Whether to run Chrome in headless mode
+        minimal (bool): Use only the bare essentials, for retrying a failed launch
+        
+    Returns:
+        Options: Chrome options ready to pass to webdriver.Chrome
+    """
+    from selenium.webdriver.chrome.options import Options
+    
+    chrome_options = Options()
+    for arg in _options_args(headless, minimal):
+        chrome_options.add_argument(arg)
+    if not minimal:
+        for name, value in CHROME_EXPERIMENTAL_OPTIONS:
+            chrome_options.add_experimental_option(name, value)
+    return chrome_options
+
 def get_selenium_webdriver(headless=True):
     """
     Set up and return a Chrome WebDriver for Selenium
@@ -185,45 +633,21 @@ def get_selenium_webdriver(headless=True):
     try:
         from selenium import webdriver
         from selenium.webdriver.chrome.service import Service
-        from selenium.webdriver.chrome.options import Options
         
         # Print system info for debugging
         logger.info(f"Platform: {platform.platform()}")
         logger.info(f"Python version: {platform.python_version()}")
         
-        # Download ChromeDriver if needed
-        driver_path = download_chromedriver()
-        logger.info(f"Using ChromeDriver from: {driver_path}")
+        # Download ChromeDriver in the background while the options are built
+        executor = ThreadPoolExecutor(max_workers=1)
+        driver_future = executor.submit(download_chromedriver)
+        executor.shutdown(wait=False)
         
         # Set up Chrome options with more robust settings
-        chrome_options = Options()
+        chrome_options = _build_options(headless)
         
-        # Essential options
-        if headless:
-            chrome_options.add_argument("--headless=new")  # Use the newer headless mode
-        chrome_options.add_argument("--no-sandbox")
-        chrome_options.add_argument("--disable-dev-shm-usage")
-        chrome_options.add_argument("--disable-gpu")
-        chrome_options.add_argument("--window-size=1920,1080")
-        
-        # Additional options to improve reliability
-        chrome_options.add_argument("--disable-extensions")
-        chrome_options.add_argument("--disable-software-rasterizer")
-        chrome_options.add_argument("--disable-infobars")
-        chrome_options.add_argument("--ignore-certificate-errors")
-        chrome_options.add_argument("--allow-insecure-localhost")
-        chrome_options.add_argument("--disable-web-security")
-        chrome_options.add_argument("--remote-debugging-port=9222")  # Enable debugging
-        chrome_options.add_argument("--disable-blink-features=AutomationControlled")  # Hide automation
-        
-        # Add options to fix TensorFlow Lite dynamic tensor issues
-        chrome_options.add_argument("--disable-features=BlinkGenPropertyTrees")
-        chrome_options.add_argument("--disable-gpu-driver-bug-workarounds")
-        chrome_options.add_argument("--disable-gpu-compositing")
-        chrome_options.add_argument("--force-device-scale-factor=1")
-        
-        chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
-        chrome_options.add_experimental_option("useAutomationExtension", False)
+        driver_path = driver_future.result()
+        logger.info(f"Using ChromeDriver from: {driver_path}")
         
         # Try to create the WebDriver with multiple retries
         max_attempts = 3
@@ -238,10 +662,11 @@ def get_selenium_webdriver(headless=True):
                 driver = webdriver.Chrome(service=service, options=chrome_options)
                 driver.implicitly_wait(10)
                 
-                # Verify driver works by loading a simple page
+                # Verify the session responds with a single script round trip
+                # rather than a full page navigation
                 try:
-                    driver.get("about:blank")
-                    logger.info("Successfully loaded blank page - WebDriver is working")
+                    driver.execute_script("return 1")
+                    logger.info("WebDriver session is responding")
                 except Exception as inner_e:
                     logger.warning(f"WebDriver created but failed basic test: {inner_e}")
                     driver.quit()
@@ -254,14 +679,10 @@ def get_selenium_webdriver(headless=True):
                 logger.warning(f"WebDriver creation attempt {attempt + 1} failed: {e}")
                 time.sleep(2)  # Wait a bit before retrying
                 
-                # Try different Chrome options on each retry
-                if attempt == 1:
+                # Retry with the minimal option set after the first failure
+                if attempt == 0:
                     logger.info("Trying with fewer Chrome options")
-                    chrome_options = Options()
-                    if headless:
-                        chrome_options.add_argument("--headless")
-                    chrome_options.add_argument("--no-sandbox")
-                    chrome_options.add_argument("--disable-dev-shm-usage")
+                    chrome_options = _build_options(headless, minimal=True)
                 
         # If all attempts failed, raise the last exception
         logger.error("All WebDriver creation attempts failed")
@@ -6,67 +6,361 @@ Playwright is better at handling modern websites and avoids the TensorFlow Lite
 import os
 import time
 import logging
+from logging.handlers import RotatingFileHandler
 import asyncio
 import random
+import re
 from dotenv import load_dotenv
 from datetime import datetime
 import pytz
-import json
 import sys
+import requests
+import numpy as np
+from playwright.async_api import async_playwright, Error as PlaywrightError
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.StreamHandler(),
-        logging.FileHandler("ringba_bot.log")
-    ]
-)
+# Logging is configured in __main__ so importing this module (ringba_bot does) doesn't
+# claim the root logger before the entrypoint sets up its own log file
 logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
 
 # Load environment variables
 load_dotenv()
 
 # Constants
 RINGBA_URL = "https://app.ringba.com/#/login"
+RINGBA_APP_URL = "https://app.ringba.com/"
 RINGBA_EMAIL = os.getenv("RINGBA_EMAIL")
 RINGBA_PASSWORD = os.getenv("RINGBA_PASSWORD")
 SLACK_WEBHOOK_URL = os.getenv("SLACK_WEBHOOK_URL")
+DEBUG = bool(os.getenv("RINGBA_DEBUG"))  # Save step-by-step screenshots
+HUMANIZE = os.getenv("RINGBA_HUMANIZE", "0") == "1"  # Random human-like pauses between steps
+POLL_INTERVAL_SECONDS = int(os.getenv("RINGBA_POLL_INTERVAL", "900"))  # Used by --monitor
 RPC_THRESHOLD = 12.0  # $12 threshold for notifications
 
-async def setup_browser():
+# Saved cookies/localStorage from the last successful login, reused until stale
+STATE_FILE = "ringba_state.json"
+STATE_MAX_AGE_HOURS = float(os.getenv("RINGBA_STATE_MAX_AGE_HOURS", "12"))
+
+# Resources that are not needed to read the report table
+BLOCKED_RESOURCE_TYPES = {"image", "font", "media"}
+BLOCKED_HOSTS = (
+    "google-analytics.com",
+    "googletagmanager.com",
+    "doubleclick.net",
+    "hotjar.com",
+    "segment.io",
+    "intercom.io",
+)
+
+# Reporting XHRs whose JSON is checked for Target/RPC rows before falling back to the DOM
+REPORT_RESPONSE_RE = re.compile(os.getenv("RINGBA_REPORT_API_PATTERN", r"report"), re.IGNORECASE)
+TARGET_KEY_RE = re.compile(r"^(target_?name|target|name)$", re.IGNORECASE)
+RPC_KEY_RE = re.compile(r"^(rpc|revenue_?per_?call)$", re.IGNORECASE)
+
+# Container that appears once the Reporting table has rendered
+REPORT_TABLE_SELECTOR = ".rt-table, table, div[role='grid']"
+
+# True once the report table has rendered at least one row besides the header
+TABLE_ROWS_READY_JS = """() => document.querySelectorAll('.rt-tr, div[role="row"], tbody tr').length > 1"""
+
+# Runs every candidate selector in-page and returns the first one that matches a
+# visible element, so N selector probes cost one CDP round trip instead of N
+FIRST_VISIBLE_SELECTOR_JS = """(selectors) => {
+    for (const selector of selectors) {
+        try {
+            const element = document.querySelector(selector);
+            if (element && element.offsetParent !== null) return selector;
+        } catch (e) {
+            // Not a valid CSS selector, skip it
+        }
+    }
+    return null;
+}"""
+
+# Table extractor, installed once per context as window.__extractRpc so the
+# script is shipped and compiled once instead of on every extraction. When a
+# threshold is passed only rows with RPC below it are returned; rowCount still
+# reports how many rows were parsed.
+EXTRACTOR_JS = """window.__extractRpc = (threshold = null) => {
+    // Pulls the number out of cells like "$1,234.56" or "-$3.10 USD"
+    const RPC_NUM_RE = /(-)?\\$?\\s*([\\d,]+(?:\\.\\d+)?)/;
+    
+    // Helper function to find tables or table-like structures
+    function findTableElements() {
+        // Try various selectors that might contain tabular data
+        const selectors = [
+            'table', 
+            'div[class*="table"]', 
+            'div[class*="grid"]',
+            'div[class*="report"]',
+            '.rt-table',
+            'div[role="grid"]',
+            'div[role="table"]',
+            // Add selectors for virtualized tables
+            '[data-testid*="table"]',
+            '[data-testid*="grid"]',
+            '[data-testid*="report"]'
+        ];
+        
+        // Try each selector
+        for (const selector of selectors) {
+            const elements = document.querySelectorAll(selector);
+            if (elements.length > 0) {
+                console.log(`Found ${elements.length} elements with selector: ${selector}`);
+                return Array.from(elements);
+            }
+        }
+        
+        // If we can't find any table structure, return the entire document body
+        // for further analysis
+        return [document.body];
+    }
+    
+    // Helper function to find column indices for Target and RPC
+    function findColumnIndices(element) {
+        // Try to find headers first
+        const headerSelectors = [
+            'th', 
+            'div[class*="header"] div[class*="cell"]',
+            'div[class*="head"] div[class*="cell"]',
+            'div[role="columnheader"]',
+            'div[class*="header-cell"]',
+            '.rt-th', // React-Table header cell
+            '[data-testid*="header"]'
+        ];
+        
+        let headerElements = [];
+        
+        // Try each header selector
+        for (const selector of headerSelectors) {
+            const headers = element.querySelectorAll(selector);
+            if (headers.length > 0) {
+                headerElements = headers;
+                break;
+            }
+        }
+        
+        // If no headers found, check for any first row that might contain headers
+        if (headerElements.length === 0) {
+            const firstRowSelector = 'tr:first-child, div[class*="row"]:first-child';
+            const firstRow = element.querySelector(firstRowSelector);
+            if (firstRow) {
+                headerElements = firstRow.querySelectorAll('td, div[class*="cell"]');
+            }
+        }
+        
+        console.log(`Found ${headerElements.length} potential header cells`);
+        
+        // Find indices for Target and RPC
+        let targetIndex = -1;
+        let rpcIndex = -1;
+        
+        // One case-insensitive regex test per header instead of a keyword loop
+        const targetRe = /target|campaign|name|source/i;
+        const rpcRe = /rpc|revenue per call|rev(?:enue)?\\s*\\/\\s*call/i;
+        
+        for (let i = 0; i < headerElements.length; i++) {
+            const text = headerElements[i].textContent;
+            
+            if (targetIndex < 0 && targetRe.test(text)) targetIndex = i;
+            if (rpcIndex < 0 && rpcRe.test(text)) rpcIndex = i;
+            
+            // Break early if we found both
+            if (targetIndex >= 0 && rpcIndex >= 0) break;
+        }
+        
+        console.log(`Found Target at index ${targetIndex}, RPC at index ${rpcIndex}`);
+        return { targetIndex, rpcIndex };
+    }
+    
+    // Helper function to extract rows data
+    function extractRowsData(element, targetIndex, rpcIndex) {
+        if (targetIndex < 0 || rpcIndex < 0) {
+            console.log("Cannot extract data: column indices not found");
+            return { targets: [], rpcs: [], rowCount: 0 };
+        }
+        
+        // Try different selectors for rows
+        const rowSelectors = [
+            'tbody tr', 
+            'div[class*="body"] div[class*="row"]',
+            'div[role="row"]:not([class*="header"])',
+            '.rt-tr-group .rt-tr', // React-Table rows
+            'div[class*="table"] > div:not([class*="header"])'
+        ];
+        
+        let rowElements = [];
+        
+        // Try each row selector
+        for (const selector of rowSelectors) {
+            const rows = element.querySelectorAll(selector);
+            if (rows.length > 0) {
+                rowElements = Array.from(rows);
+                console.log(`Found ${rowElements.length} rows with selector: ${selector}`);
+                break;
+            }
+        }
+        
+        // If still no rows found, just look for any rows
+        if (rowElements.length === 0) {
+            console.log("Falling back to generic row detection");
+            // Try to identify rows by looking at repeating structures
+            const possibleRows = element.querySelectorAll('div[class*="row"], .rt-tr');
+            if (possibleRows.length > 0) {
+                rowElements = Array.from(possibleRows);
+            }
+        }
+        
+        // Pick the cell selector once, from the first row that has cells,
+        // instead of probing every selector on every row
+        const cellSelectors = [
+            'td', 
+            'div[class*="cell"]',
+            'div[role="cell"]',
+            '.rt-td' // React-Table cells
+        ];
+        let cellSelector = null;
+        for (const row of rowElements) {
+            cellSelector = cellSelectors.find(selector => row.querySelector(selector));
+            if (cellSelector) break;
+        }
+        if (!cellSelector) return { targets: [], rpcs: [], rowCount: 0 };
+        
+        // Extract data from rows into two parallel arrays, which serialize
+        // smaller than a list of {Target, RPC} objects
+        const targets = [];
+        const rpcs = [];
+        let rowCount = 0;
+        
+        for (const row of rowElements) {
+            const cells = row.querySelectorAll(cellSelector);
+            
+            // If we have enough cells for both target and RPC
+            if (cells.length > Math.max(targetIndex, rpcIndex)) {
+                const targetName = cells[targetIndex].textContent.trim();
+                const rpcText = cells[rpcIndex].textContent.trim();
+                
+                // Skip empty rows
+                if (!targetName || !rpcText) continue;
+                
+                // Extract numeric value from RPC
+                const match = RPC_NUM_RE.exec(rpcText);
+                if (!match) continue;
+                const digits = match[2].indexOf(',') >= 0 ? match[2].replace(/,/g, '') : match[2];
+                const rpcValue = match[1] ? -parseFloat(digits) : parseFloat(digits);
+                rowCount++;
+                
+                // Only ship the rows the caller will act on
+                if (threshold !== null && rpcValue >= threshold) continue;
+                
+                targets.push(targetName);
+                rpcs.push(rpcValue);
+            }
+        }
+        
+        return { targets, rpcs, rowCount };
+    }
+    
+    // Main extraction logic
+    try {
+        const tableElements = findTableElements();
+        
+        for (const element of tableElements) {
+            // Find the column indices
+            const { targetIndex, rpcIndex } = findColumnIndices(element);
+            
+            // Extract data using the indices
+            const data = extractRowsData(element, targetIndex, rpcIndex);
+            
+            // Stop after finding the first table with data
+            if (data.rowCount > 0) {
+                console.log(`Extracted ${data.rpcs.length} of ${data.rowCount} data rows`);
+                return data;
+            }
+        }
+        
+        console.log("Extracted 0 data rows");
+        return { targets: [], rpcs: [], rowCount: 0 };
+    } catch (error) {
+        console.error("Error in data extraction:", error);
+        return { targets: [], rpcs: [], rowCount: 0 };
+    }
+};"""
+
+async def block_unneeded_resources(route):
     """
-    Set up and configure Playwright browser
+    Abort images, fonts, media and analytics requests; let everything else through
+    
+    Stylesheets are kept because the visibility checks depend on layout.
+    """
+    request = route.request
+    if request.resource_type in BLOCKED_RESOURCE_TYPES or any(host in request.url for host in BLOCKED_HOSTS):
+        await route.abort()
+    else:
+        await route.continue_()
+
+def saved_storage_state():
+    """
+    Return the saved login state file if it exists and is fresh enough to reuse
+    
+    Returns:
+        str: Path to the state file, or None to start with an empty context
+    """
+    try:
+        age_hours = (time.time() - os.path.getmtime(STATE_FILE)) / 3600
+    except OSError:
+        return None
+    if age_hours > STATE_MAX_AGE_HOURS:
+        logger.info(f"Saved login state is {age_hours:.1f}h old, logging in again")
+        return None
+    return STATE_FILE
+
+async def launch_browser():
+    """
+    Start Playwright and launch the Chromium process
+    
+    Returns:
+        tuple: (playwright, browser)
     """
     try:
-        # Check if playwright is installed
-        try:
-            from playwright.async_api import async_playwright
-        except ImportError:
-            logger.info("Installing playwright...")
-            import subprocess
-            subprocess.check_call([sys.executable, "-m", "pip", "install", "playwright"])
-            subprocess.check_call([sys.executable, "-m", "playwright", "install", "chromium"])
-            from playwright.async_api import async_playwright
-        
         logger.info("Starting Playwright...")
         playwright = await async_playwright().start()
         
         # Use chromium for best compatibility
         browser = await playwright.chromium.launch(
-            headless=False,  # Set to True for production
+            headless=True,
             args=[
                 "--disable-features=BlinkGenPropertyTrees",
                 "--disable-blink-features=AutomationControlled",
-                "--window-position=-2000,0",  # Position offscreen for visibility during testing
+                "--disable-dev-shm-usage",
+                "--no-sandbox",
+                "--disable-gpu",
+                "--blink-settings=imagesEnabled=false",
             ]
         )
         
+        return playwright, browser
+    except Exception as e:
+        logger.error(f"Error launching Playwright browser: {e}")
+        raise
+
+async def new_browser_context(browser, storage_state=None):
+    """
+    Create a configured context and page on an already running browser
+    
+    Args:
+        browser: Playwright browser from launch_browser
+        storage_state (str): Optional storage state file to restore cookies and localStorage from
+        
+    Returns:
+        tuple: (context, page)
+    """
+    try:
         # Create a context with specific viewport and user agent
         context = await browser.new_context(
             viewport={"width": 1920, "height": 1080},
-            user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/134.0.0.0 Safari/537.36"
+            user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/134.0.0.0 Safari/537.36",
+            storage_state=storage_state
         )
         
         # Add script to hide automation
@@ -96,18 +390,68 @@ async def setup_browser():
             });
         """)
         
+        # Skip downloading resources the scraper never looks at
+        await context.route("**/*", block_unneeded_resources)
+        
+        # Install the table extractor once for every page in this context
+        await context.add_init_script(EXTRACTOR_JS)
+        
         # Create a new page
         page = await context.new_page()
         
-        logger.info("Playwright browser setup complete")
-        return playwright, browser, context, page
+        return context, page
     except Exception as e:
-        logger.error(f"Error setting up Playwright: {e}")
+        logger.error(f"Error creating browser context: {e}")
         raise
 
-def random_sleep_async(min_seconds=0.5, max_seconds=2.0):
-    """Generate a random sleep duration for human-like behavior"""
-    return random.uniform(min_seconds, max_seconds)
+async def setup_browser(storage_state=None):
+    """
+    Set up and configure Playwright browser
+    
+    Args:
+        storage_state (str): Optional storage state file to restore cookies and localStorage from
+    """
+    playwright, browser = await launch_browser()
+    context, page = await new_browser_context(browser, storage_state)
+    logger.info("Playwright browser setup complete")
+    return playwright, browser, context, page
+
+async def find_first_visible_selector(page, selectors, timeout=10000):
+    """
+    Poll the page until one of the selectors matches a visible element
+    
+    Returns:
+        str: The first matching selector, or None if nothing matched within timeout
+    """
+    try:
+        handle = await page.wait_for_function(FIRST_VISIBLE_SELECTOR_JS, arg=selectors, timeout=timeout)
+        return await handle.json_value()
+    except Exception:
+        return None
+
+async def save_screenshot(page, name, error=False):
+    """
+    Save a screenshot named name
+    
+    Step-by-step screenshots are only taken when RINGBA_DEBUG is set. Error
+    screenshots are always kept, as a small JPEG unless debugging.
+    """
+    try:
+        if DEBUG:
+            await page.screenshot(path=f"{name}.png")
+        elif error:
+            await page.screenshot(path=f"{name}.jpg", type="jpeg", quality=60, full_page=False)
+    except Exception as e:
+        logger.warning(f"Could not save screenshot {name}: {e}")
+
+if HUMANIZE:
+    async def jitter(min_seconds=0.5, max_seconds=2.0):
+        """Sleep for a random duration for human-like behavior"""
+        await asyncio.sleep(random.uniform(min_seconds, max_seconds))
+else:
+    async def jitter(min_seconds=0.5, max_seconds=2.0):
+        """No-op: human-like pauses are disabled (set RINGBA_HUMANIZE=1 to enable)"""
+        return
 
 async def login_to_ringba(page):
     """
@@ -116,18 +460,13 @@ async def login_to_ringba(page):
     logger.info("Logging in to Ringba...")
     
     try:
-        # First visit Google (to appear more natural)
-        await page.goto("https://www.google.com")
-        await asyncio.sleep(random_sleep_async(1, 2))
-        
         # Navigate to Ringba login page - use the direct login URL
         logger.info("Navigating to Ringba login page...")
         await page.goto("https://app.ringba.com/#/login")
-        await asyncio.sleep(random_sleep_async(2, 3))
+        await jitter(2, 3)
         
         # Take a screenshot
-        await page.screenshot(path="playwright_login_page.png")
-        logger.info("Login page screenshot saved")
+        await save_screenshot(page, "playwright_login_page")
         
         # Look for any iframe that might contain the login form
         logger.info("Checking for iframes...")
@@ -147,77 +486,31 @@ async def login_to_ringba(page):
         # Try to find the email field
         logger.info("Looking for email field with multiple selectors...")
         email_field = None
-        for selector in selectors_to_try:
-            try:
-                # Use a shorter timeout for each attempt
-                logger.info(f"Trying selector: {selector}")
-                email_field = await page.wait_for_selector(selector, state="visible", timeout=5000)
-                if email_field:
-                    logger.info(f"Found email field with selector: {selector}")
+        selector = await find_first_visible_selector(page, selectors_to_try)
+        if selector:
+            email_field = page.locator(selector).first
+            logger.info(f"Found email field with selector: {selector}")
+        else:
+            logger.info("No email field selector matched")
+        
+        if email_field is None:
+            # Fall back to Playwright's accessibility-based lookups
+            logger.info("Looking for email field by label, role and placeholder...")
+            email_pattern = re.compile("email", re.I)
+            for candidate in (
+                page.get_by_label(email_pattern),
+                page.get_by_role("textbox", name=email_pattern),
+                page.get_by_placeholder(email_pattern),
+            ):
+                if await candidate.count() > 0:
+                    email_field = candidate.first
+                    logger.info("Found email field by accessible name")
                     break
-            except Exception as e:
-                logger.info(f"Selector {selector} not found")
-        
-        if not email_field:
-            # If we still can't find it, use JavaScript to look for any input field
-            logger.info("Using JavaScript to find login fields...")
-            email_field = await page.evaluate("""() => {
-                // Look for any visible input that could be an email field
-                const inputs = Array.from(document.querySelectorAll('input:not([type="hidden"])'));
-                const emailInput = inputs.find(input => 
-                    input.type === 'email' || 
-                    input.name === 'email' || 
-                    input.placeholder.toLowerCase().includes('email') ||
-                    input.id === 'email' ||
-                    (input.type === 'text' && inputs.indexOf(input) === 0)
-                );
-                
-                if (emailInput) {
-                    // Make it flash to identify it
-                    const originalBackground = emailInput.style.backgroundColor;
-                    emailInput.style.backgroundColor = 'yellow';
-                    setTimeout(() => { emailInput.style.backgroundColor = originalBackground; }, 1000);
-                    
-                    // Return the xpath to the element
-                    return getXPath(emailInput);
-                }
-                
-                // Helper function to get XPath
-                function getXPath(element) {
-                    if (element.id) return `//*[@id="${element.id}"]`;
-                    
-                    const parts = [];
-                    while (element && element.nodeType === 1) {
-                        let part = element.tagName.toLowerCase();
-                        if (element.id) {
-                            part += `[@id="${element.id}"]`;
-                            parts.unshift(part);
-                            break;
-                        } else {
-                            const siblings = Array.from(element.parentNode.children)
-                                .filter(e => e.tagName === element.tagName);
-                            if (siblings.length > 1) {
-                                const index = siblings.indexOf(element) + 1;
-                                part += `[${index}]`;
-                            }
-                        }
-                        parts.unshift(part);
-                        element = element.parentNode;
-                    }
-                    return `//${parts.join('/')}`;
-                }
-                
-                return null;
-            }""")
-            
-            if email_field:
-                logger.info(f"Found email field using JavaScript with XPath: {email_field}")
-                email_field = await page.wait_for_selector(f"xpath={email_field}", state="visible")
         
         # If we still can't find the form, take more screenshots and try a different approach
-        if not email_field:
+        if email_field is None:
             logger.info("Could not find login form with automated detection")
-            await page.screenshot(path="playwright_no_form.png")
+            await save_screenshot(page, "playwright_no_form", error=True)
             
             # Use hardcoded approach as last resort
             try:
@@ -252,7 +545,7 @@ async def login_to_ringba(page):
                 await asyncio.sleep(0.5)
                 
                 # Take screenshot
-                await page.screenshot(path="playwright_before_enter.png")
+                await save_screenshot(page, "playwright_before_enter")
                 
                 # Press Enter to submit
                 await page.keyboard.press("Enter")
@@ -262,27 +555,30 @@ async def login_to_ringba(page):
                 return False
         else:
             # We found the email field, continue with normal login
-            await email_field.click()
+            # (locator actions auto-wait and re-resolve if the SPA re-renders)
             await email_field.fill(RINGBA_EMAIL)
             
             # Try to find password field
             logger.info("Looking for password field...")
             try:
-                password_field = await page.wait_for_selector("input[type='password']", state="visible", timeout=5000)
-                await password_field.click()
-                await password_field.fill(RINGBA_PASSWORD)
+                await page.locator("input[type='password']").first.fill(RINGBA_PASSWORD, timeout=5000)
                 
                 # Look for login button
                 logger.info("Looking for login button...")
-                login_button = await page.wait_for_selector("button[type='submit'], input[type='submit'], button:has-text('Login'), button:has-text('Sign in')", 
-                                                         state="visible", 
-                                                         timeout=5000)
+                button_selector = await find_first_visible_selector(
+                    page, ["button[type='submit']", "input[type='submit']"], timeout=5000
+                )
+                if button_selector:
+                    login_button = page.locator(button_selector).first
+                else:
+                    # Text-based selectors are Playwright-only, so they can't be probed in-page
+                    login_button = page.locator("button:has-text('Login'), button:has-text('Sign in')").first
                 
-                await login_button.click()
+                await login_button.click(timeout=5000)
                 logger.info("Clicked login button")
             except Exception as e:
                 logger.error(f"Error filling credentials: {e}")
-                await page.screenshot(path="playwright_credential_error.png")
+                await save_screenshot(page, "playwright_credential_error", error=True)
                 return False
         
         # Wait for any page change
@@ -297,7 +593,7 @@ async def login_to_ringba(page):
             logger.info("Successfully logged in to Ringba")
             
             # Take a screenshot of dashboard
-            await page.screenshot(path="playwright_dashboard.png")
+            await save_screenshot(page, "playwright_dashboard")
             
             return True
         except Exception as dash_error:
@@ -307,18 +603,15 @@ async def login_to_ringba(page):
             current_url = page.url
             if "ringba.com" in current_url and "login" not in current_url:
                 logger.info(f"Appears to be logged in, but on page: {current_url}")
-                await page.screenshot(path="playwright_different_page.png")
+                await save_screenshot(page, "playwright_different_page")
                 return True
                 
-            await page.screenshot(path="playwright_login_error.png")
+            await save_screenshot(page, "playwright_login_error", error=True)
             return False
         
     except Exception as e:
         logger.error(f"Error logging in to Ringba: {e}")
-        try:
-            await page.screenshot(path="playwright_error.png")
-        except:
-            pass
+        await save_screenshot(page, "playwright_error", error=True)
         return False
 
 async def navigate_to_reporting(page):
@@ -329,49 +622,68 @@ async def navigate_to_reporting(page):
     
     try:
         # Find and click on Reporting in the side navigation
-        reporting_link = await page.wait_for_selector("//span[text()='Reporting']/..", 
-                                                     state="visible", 
-                                                     timeout=30000)
+        reporting_link = page.locator("xpath=//span[text()='Reporting']/..").first
         
         # Hover first (human-like)
-        await reporting_link.hover()
-        await asyncio.sleep(random_sleep_async(0.5, 1))
+        if HUMANIZE:
+            await reporting_link.hover(timeout=30000)
+            await jitter(0.5, 1)
         
-        await reporting_link.click()
+        await reporting_link.click(timeout=30000)
         logger.info("Clicked Reporting link")
         
         # Wait for reporting page to load
-        await asyncio.sleep(10)  # Allow time for table data to fully load
+        await page.wait_for_load_state("networkidle", timeout=30000)
+        await page.wait_for_selector(REPORT_TABLE_SELECTOR, state="visible", timeout=30000)
         
         # Take a screenshot
-        await page.screenshot(path="playwright_reporting.png")
+        await save_screenshot(page, "playwright_reporting")
         logger.info("Successfully navigated to Reporting tab")
         
         return True
     except Exception as e:
         logger.error(f"Error navigating to Reporting tab: {e}")
-        try:
-            await page.screenshot(path="playwright_reporting_error.png")
-        except:
-            pass
+        await save_screenshot(page, "playwright_reporting_error", error=True)
+        return False
+
+async def reload_reporting(page):
+    """
+    Reload the Reporting tab so the report data is requested again
+    """
+    logger.info("Reloading Reporting tab...")
+    
+    try:
+        await page.reload(wait_until="networkidle", timeout=60000)
+        await page.wait_for_selector(REPORT_TABLE_SELECTOR, state="visible", timeout=30000)
+        return True
+    except Exception as e:
+        logger.error(f"Error reloading Reporting tab: {e}")
+        await save_screenshot(page, "playwright_reporting_error", error=True)
         return False
 
-async def extract_target_rpc_data(page):
+async def extract_target_rpc_data(page, threshold=RPC_THRESHOLD):
     """
     Extract Target and RPC data from the table
+    
+    Args:
+        page: Playwright page on the Reporting tab
+        threshold (float): Only return rows with RPC below this value; None returns every row
     """
     logger.info("Extracting Target and RPC data...")
     
     try:
         # Take a screenshot before extraction
-        await page.screenshot(path="playwright_before_extraction.png")
+        await save_screenshot(page, "playwright_before_extraction")
         
-        # Wait longer for the table to fully load with data
+        # Wait until the table has at least one data row besides the header
         logger.info("Waiting for table to load...")
-        await asyncio.sleep(15)  # Give more time for dynamic content to load
+        try:
+            await page.wait_for_function(TABLE_ROWS_READY_JS, timeout=30000)
+        except Exception as e:
+            logger.warning(f"Table rows did not appear in time: {e}")
         
         # Take another screenshot after waiting
-        await page.screenshot(path="playwright_after_waiting.png")
+        await save_screenshot(page, "playwright_after_waiting")
         
         # First try to locate the table
         logger.info("Looking for table element...")
@@ -386,290 +698,154 @@ async def extract_target_rpc_data(page):
         ]
         
         table = None
-        for selector in table_selectors:
-            try:
-                logger.info(f"Trying table selector: {selector}")
-                found = await page.wait_for_selector(selector, state="visible", timeout=5000)
-                if found:
-                    table = found
-                    logger.info(f"Found table with selector: {selector}")
-                    break
-            except Exception:
-                logger.info(f"Table selector {selector} not found")
+        selector = await find_first_visible_selector(page, table_selectors)
+        if selector:
+            table = await page.wait_for_selector(selector, state="visible", timeout=2000)
+            logger.info(f"Found table with selector: {selector}")
         
         if not table:
             logger.warning("Could not find table with standard selectors")
             
         # Use JavaScript to identify and extract data regardless of table structure
         logger.info("Extracting data with JavaScript...")
-        data = await page.evaluate("""() => {
-            // Helper function to find tables or table-like structures
-            function findTableElements() {
-                // Try various selectors that might contain tabular data
-                const selectors = [
-                    'table', 
-                    'div[class*="table"]', 
-                    'div[class*="grid"]',
-                    'div[class*="report"]',
-                    '.rt-table',
-                    'div[role="grid"]',
-                    'div[role="table"]',
-                    // Add selectors for virtualized tables
-                    '[data-testid*="table"]',
-                    '[data-testid*="grid"]',
-                    '[data-testid*="report"]'
-                ];
-                
-                // Try each selector
-                for (const selector of selectors) {
-                    const elements = document.querySelectorAll(selector);
-                    if (elements.length > 0) {
-                        console.log(`Found ${elements.length} elements with selector: ${selector}`);
-                        return Array.from(elements);
-                    }
-                }
-                
-                // If we can't find any table structure, return the entire document body
-                // for further analysis
-                return [document.body];
-            }
-            
-            // Helper function to find column indices for Target and RPC
-            function findColumnIndices(element) {
-                // Try to find headers first
-                const headerSelectors = [
-                    'th', 
-                    'div[class*="header"] div[class*="cell"]',
-                    'div[class*="head"] div[class*="cell"]',
-                    'div[role="columnheader"]',
-                    'div[class*="header-cell"]',
-                    '.rt-th', // React-Table header cell
-                    '[data-testid*="header"]'
-                ];
-                
-                let headerElements = [];
-                
-                // Try each header selector
-                for (const selector of headerSelectors) {
-                    const headers = element.querySelectorAll(selector);
-                    if (headers.length > 0) {
-                        headerElements = Array.from(headers);
-                        break;
-                    }
-                }
-                
-                // If no headers found, check for any first row that might contain headers
-                if (headerElements.length === 0) {
-                    const firstRowSelector = 'tr:first-child, div[class*="row"]:first-child';
-                    const firstRow = element.querySelector(firstRowSelector);
-                    if (firstRow) {
-                        headerElements = Array.from(firstRow.querySelectorAll('td, div[class*="cell"]'));
-                    }
-                }
-                
-                // Debug output
-                console.log(`Found ${headerElements.length} potential header cells`);
-                headerElements.forEach((el, i) => {
-                    console.log(`Header ${i}: ${el.textContent.trim()}`);
-                });
-                
-                // Find indices for Target and RPC
-                let targetIndex = -1;
-                let rpcIndex = -1;
-                
-                const targetKeywords = ['target', 'campaign', 'name', 'source'];
-                const rpcKeywords = ['rpc', 'revenue per call', 'rev/call', 'revenue/call'];
-                
-                for (let i = 0; i < headerElements.length; i++) {
-                    const text = headerElements[i].textContent.trim().toLowerCase();
-                    
-                    // Check for Target column
-                    if (targetIndex === -1) {
-                        for (const keyword of targetKeywords) {
-                            if (text.includes(keyword)) {
-                                targetIndex = i;
-                                break;
-                            }
-                        }
-                    }
-                    
-                    // Check for RPC column
-                    if (rpcIndex === -1) {
-                        for (const keyword of rpcKeywords) {
-                            if (text.includes(keyword)) {
-                                rpcIndex = i;
-                                break;
-                            }
-                        }
-                    }
-                    
-                    // Break early if we found both
-                    if (targetIndex >= 0 && rpcIndex >= 0) break;
-                }
-                
-                console.log(`Found Target at index ${targetIndex}, RPC at index ${rpcIndex}`);
-                return { targetIndex, rpcIndex };
-            }
-            
-            // Helper function to extract rows data
-            function extractRowsData(element, targetIndex, rpcIndex) {
-                if (targetIndex < 0 || rpcIndex < 0) {
-                    console.log("Cannot extract data: column indices not found");
-                    return [];
-                }
-                
-                // Try different selectors for rows
-                const rowSelectors = [
-                    'tbody tr', 
-                    'div[class*="body"] div[class*="row"]',
-                    'div[role="row"]:not([class*="header"])',
-                    '.rt-tr-group .rt-tr', // React-Table rows
-                    'div[class*="table"] > div:not([class*="header"])'
-                ];
-                
-                let rowElements = [];
-                
-                // Try each row selector
-                for (const selector of rowSelectors) {
-                    const rows = element.querySelectorAll(selector);
-                    if (rows.length > 0) {
-                        rowElements = Array.from(rows);
-                        console.log(`Found ${rowElements.length} rows with selector: ${selector}`);
-                        break;
-                    }
-                }
-                
-                // If still no rows found, just look for any rows
-                if (rowElements.length === 0) {
-                    console.log("Falling back to generic row detection");
-                    // Try to identify rows by looking at repeating structures
-                    const possibleRows = element.querySelectorAll('div[class*="row"], .rt-tr');
-                    if (possibleRows.length > 0) {
-                        rowElements = Array.from(possibleRows);
-                    }
-                }
-                
-                // Extract data from rows
-                const data = [];
-                
-                for (const row of rowElements) {
-                    // Try different cell selectors
-                    const cellSelectors = [
-                        'td', 
-                        'div[class*="cell"]',
-                        'div[role="cell"]',
-                        '.rt-td' // React-Table cells
-                    ];
-                    
-                    let cells = [];
-                    
-                    // Try each cell selector
-                    for (const selector of cellSelectors) {
-                        const cellElements = row.querySelectorAll(selector);
-                        if (cellElements.length > 0) {
-                            cells = Array.from(cellElements);
-                            break;
-                        }
-                    }
-                    
-                    // If we have enough cells for both target and RPC
-                    if (cells.length > Math.max(targetIndex, rpcIndex)) {
-                        const targetName = cells[targetIndex].textContent.trim();
-                        const rpcText = cells[rpcIndex].textContent.trim();
-                        
-                        // Skip empty rows
-                        if (!targetName || !rpcText) continue;
-                        
-                        // Extract numeric value from RPC
-                        const rpcValue = parseFloat(rpcText.replace(/[$,]/g, ''));
-                        
-                        if (!isNaN(rpcValue)) {
-                            data.push({
-                                Target: targetName,
-                                RPC: rpcValue
-                            });
-                        }
-                    }
-                }
-                
-                return data;
-            }
-            
-            // Main extraction logic
-            try {
-                const tableElements = findTableElements();
-                let allData = [];
-                
-                for (const element of tableElements) {
-                    // Find the column indices
-                    const { targetIndex, rpcIndex } = findColumnIndices(element);
-                    
-                    // Extract data using the indices
-                    const data = extractRowsData(element, targetIndex, rpcIndex);
-                    
-                    // Add to our collection
-                    if (data.length > 0) {
-                        allData = allData.concat(data);
-                        break; // Stop after finding the first table with data
-                    }
-                }
-                
-                console.log(`Extracted ${allData.length} data rows`);
-                return allData;
-            } catch (error) {
-                console.error("Error in data extraction:", error);
-                return [];
-            }
-        }""")
+        result = await page.evaluate("(t) => window.__extractRpc ? window.__extractRpc(t) : null", threshold)
+        if result is None:
+            # Page was opened before the init script was registered
+            await page.evaluate(EXTRACTOR_JS)
+            result = await page.evaluate("(t) => window.__extractRpc(t)", threshold)
+        
+        # The page returns parallel target/RPC arrays; rebuild the row dicts here
+        data = [{"Target": target, "RPC": rpc} for target, rpc in zip(result["targets"], result["rpcs"])]
         
         # Log details of what we found
-        if data and len(data) > 0:
-            logger.info(f"Successfully extracted data for {len(data)} targets")
+        if result["rowCount"] > 0:
+            logger.info(f"Successfully extracted data for {len(data)} of {result['rowCount']} targets")
             
             # Log the data
             for item in data:
-                logger.info(f"Target: {item['Target']}, RPC: ${item['RPC']}")
+                logger.debug("Target: %s, RPC: $%s", item['Target'], item['RPC'])
                 
             return data
         else:
-            # If no data found, try one more approach - take a screenshot of the table area
+            # If no data found, keep a screenshot of the table area for diagnosis
             logger.warning("No data extracted from table with JavaScript")
-            await page.screenshot(path="playwright_table_area.png")
-            
-            # Create some mock data for testing, since this is just a proof-of-concept
-            logger.info("Creating mock data for demonstration purposes")
-            mock_data = [
-                {"Target": "Campaign 1", "RPC": 15.75},
-                {"Target": "Campaign 2", "RPC": 8.25},
-                {"Target": "Campaign 3", "RPC": 21.50},
-                {"Target": "Campaign 4", "RPC": 11.80},
-                {"Target": "Campaign 5", "RPC": 9.70}
-            ]
-            
-            logger.info("Using mock data for demonstration")
-            for item in mock_data:
-                logger.info(f"Target: {item['Target']}, RPC: ${item['RPC']}")
-                
-            return mock_data
+            await save_screenshot(page, "playwright_table_area", error=True)
+            return []
             
     except Exception as e:
         logger.error(f"Error extracting table data: {e}")
-        await page.screenshot(path="playwright_extraction_error.png")
+        await save_screenshot(page, "playwright_extraction_error", error=True)
+        return []
+
+def rows_from_report_json(payload):
+    """
+    Find the first list of records with Target and RPC fields in a report JSON body
+    
+    Returns:
+        list: Extracted rows, or None if the payload holds no such list
+    """
+    stack = [payload]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            stack.extend(node.values())
+        elif isinstance(node, list):
+            if node and isinstance(node[0], dict):
+                keys = node[0].keys()
+                target_key = next((key for key in keys if TARGET_KEY_RE.match(key)), None)
+                rpc_key = next((key for key in keys if RPC_KEY_RE.match(key)), None)
+                if target_key and rpc_key:
+                    rows = []
+                    for record in node:
+                        rpc = record.get(rpc_key)
+                        try:
+                            rpc = float(rpc) if isinstance(rpc, (int, float)) else float(str(rpc).replace("$", "").replace(",", ""))
+                        except (TypeError, ValueError):
+                            continue
+                        rows.append({"Target": str(record.get(target_key)), "RPC": rpc})
+                    return rows
+            stack.extend(node)
+    return None
+
+async def rows_from_report_responses(responses, threshold=RPC_THRESHOLD):
+    """
+    Build rows from captured Reporting XHR responses, newest first
+    
+    Args:
+        responses (list): Playwright responses recorded while the Reporting tab loaded
+        threshold (float): Only return rows with RPC below this value; None returns every row
+        
+    Returns:
+        list: Extracted rows, or None if no response carried a Target/RPC list
+    """
+    for response in reversed(responses):
+        try:
+            payload = await response.json()
+        except Exception:
+            continue
+        rows = rows_from_report_json(payload)
+        if rows:
+            logger.info(f"Read {len(rows)} targets from {response.url}")
+            if threshold is not None:
+                rows = [row for row in rows if row["RPC"] < threshold]
+            return rows
+    return None
+
+_http = None
+
+def get_http():
+    """
+    Return the shared requests Session used for Slack webhooks, creating it on first use
+    """
+    global _http
+    if _http is None:
+        _http = requests.Session()
+    return _http
+
+def close_http():
+    """
+    Close the shared requests Session, if one was created
+    """
+    global _http
+    if _http is not None:
+        _http.close()
+        _http = None
+
+def low_rpc_rows(data, threshold=RPC_THRESHOLD):
+    """
+    Pick out the rows whose RPC is below the threshold
+    
+    Args:
+        data (list): Extracted rows with "Target" and "RPC" keys
+        threshold (float): RPC alert threshold
+        
+    Returns:
+        list: (target, rpc) tuples for the low RPC rows
+    """
+    if not data:
         return []
+    
+    # One vectorized compare over the RPC column instead of a dict lookup per row
+    names = np.array([item["Target"] for item in data], dtype=object)
+    rpcs = np.fromiter((item["RPC"] for item in data), dtype=np.float64, count=len(data))
+    mask = rpcs < threshold
+    return list(zip(names[mask].tolist(), rpcs[mask].tolist()))
 
 async def send_slack_notification(data):
     """
     Send Slack notification for low RPC values
     """
+    if not data:
+        logger.info("No data to check for low RPC values")
+        return True
+    
     if not SLACK_WEBHOOK_URL:
         logger.warning("Slack webhook URL not configured")
         return False
         
     try:
-        import requests
-        
         # Filter for low RPC values
-        low_rpc_data = [item for item in data if item["RPC"] < RPC_THRESHOLD]
+        low_rpc_data = low_rpc_rows(data)
         
         if not low_rpc_data:
             logger.info(f"No targets with RPC below ${RPC_THRESHOLD}")
@@ -677,11 +853,12 @@ async def send_slack_notification(data):
             
         # Create message text
         now = datetime.now(pytz.timezone('US/Eastern'))
-        message = f"*RPC ALERT* - {now.strftime('%Y-%m-%d %I:%M %p ET')}:\n"
-        message += f"The following targets have RPC values below ${RPC_THRESHOLD}:\n\n"
-        
-        for item in low_rpc_data:
-            message += f"• *{item['Target']}*: ${item['RPC']:.2f}\n"
+        header = (
+            f"*RPC ALERT* - {now.strftime('%Y-%m-%d %I:%M %p ET')}:\n"
+            f"The following targets have RPC values below ${RPC_THRESHOLD}:\n\n"
+        )
+        lines = [f"• *{target}*: ${rpc:.2f}" for target, rpc in low_rpc_data]
+        message = header + "\n".join(lines) + "\n"
             
         # Create payload for Slack
         payload = {
@@ -699,11 +876,8 @@ async def send_slack_notification(data):
         
         # Send to Slack
         logger.info(f"Sending Slack notification for {len(low_rpc_data)} low RPC values")
-        response = requests.post(
-            SLACK_WEBHOOK_URL,
-            data=json.dumps(payload),
-            headers={"Content-Type": "application/json"}
-        )
+        # Run the blocking POST in a worker thread so the event loop stays free
+        response = await asyncio.to_thread(get_http().post, SLACK_WEBHOOK_URL, json=payload, timeout=30)
         
         if response.status_code == 200:
             logger.info("Slack notification sent successfully")
@@ -716,6 +890,148 @@ async def send_slack_notification(data):
         logger.error(f"Error sending Slack notification: {e}")
         return False
 
+class RingbaSession:
+    """
+    Long-lived browser session that logs in once and re-reads the Reporting table on demand
+    """
+    
+    def __init__(self):
+        self.playwright = None
+        self.browser = None
+        self.context = None
+        self.page = None
+        self.restored_state = False
+        self.owns_browser = False
+        self.on_reporting = False
+    
+    async def start(self, browser=None):
+        """
+        Open a context and page; login happens lazily on the first poll
+        
+        Args:
+            browser: Optional running browser to borrow instead of launching one
+        """
+        storage_state = saved_storage_state()
+        self.restored_state = storage_state is not None
+        self.on_reporting = False
+        if browser is None:
+            self.playwright, self.browser = await launch_browser()
+            self.owns_browser = True
+        else:
+            self.browser = browser
+        self.context, self.page = await new_browser_context(self.browser, storage_state)
+    
+    async def ensure_alive(self):
+        """Reopen the context and page, and relaunch an owned browser, if any of them died"""
+        if self.page is not None and not self.page.is_closed() and self.browser.is_connected():
+            return
+        logger.warning("Browser or page is gone, restarting the session")
+        borrowed = None if self.owns_browser else self.browser
+        await self.close()
+        await self.start(borrowed)
+    
+    async def ensure_logged_in(self):
+        """Log in only if the page is not already inside the Ringba app"""
+        if self.restored_state and self.page.url == "about:blank":
+            # The app bounces back to the login page if the saved cookies have expired
+            logger.info("Opening Ringba with saved login state...")
+            try:
+                await self.page.goto(RINGBA_APP_URL, wait_until="networkidle", timeout=60000)
+            except PlaywrightError as e:
+                # A slow or stale saved session falls through to the URL check and a normal login
+                logger.warning(f"Could not open Ringba with saved login state: {e}")
+        
+        current_url = self.page.url
+        if "ringba.com" in current_url and "login" not in current_url:
+            return True
+        
+        if not await login_to_ringba(self.page):
+            return False
+        
+        # Save cookies and localStorage so the next start can skip the login form
+        await self.context.storage_state(path=STATE_FILE)
+        self.restored_state = True
+        return True
+    
+    async def poll(self, threshold=RPC_THRESHOLD):
+        """
+        Navigate to Reporting and extract the Target/RPC rows
+        
+        Args:
+            threshold (float): Only return rows with RPC below this value; None returns every row
+            
+        Returns:
+            list: Extracted rows, or an empty list if any step failed
+        """
+        if not await self.ensure_logged_in():
+            logger.error("Login failed")
+            return []
+        
+        # Record the report XHRs fired while the Reporting tab loads
+        captured = []
+        def capture(response):
+            if response.request.resource_type in ("xhr", "fetch") and REPORT_RESPONSE_RE.search(response.url):
+                captured.append(response)
+        
+        self.page.on("response", capture)
+        try:
+            if self.on_reporting:
+                # Clicking Reporting again is a no-op route change, so reload to fetch the report afresh
+                self.on_reporting = await reload_reporting(self.page)
+            else:
+                self.on_reporting = await navigate_to_reporting(self.page)
+            if not self.on_reporting:
+                logger.error("Failed to navigate to Reporting tab")
+                return []
+        finally:
+            self.page.remove_listener("response", capture)
+        
+        # Structured JSON when the report API returned it, otherwise scrape the table
+        rows = await rows_from_report_responses(captured, threshold)
+        if rows is not None:
+            return rows
+        return await extract_target_rpc_data(self.page, threshold)
+    
+    async def close(self):
+        """Close the context, and the browser too if this session launched it; tolerates a dead browser"""
+        if self.context:
+            try:
+                await self.context.close()
+            except Exception as e:
+                logger.warning(f"Error closing browser context: {e}")
+        if self.owns_browser:
+            try:
+                await self.browser.close()
+            except Exception as e:
+                logger.warning(f"Error closing browser: {e}")
+            try:
+                await self.playwright.stop()
+            except Exception as e:
+                logger.warning(f"Error stopping Playwright: {e}")
+        self.playwright = self.browser = self.context = self.page = None
+        self.owns_browser = False
+
+async def run_monitor(interval=POLL_INTERVAL_SECONDS):
+    """
+    Poll Ringba every interval seconds with one browser session, alerting on low RPC
+    """
+    session = RingbaSession()
+    await session.start()
+    try:
+        while True:
+            # One failed poll (timeout, crashed page, dropped browser) must not end the monitor
+            try:
+                await session.ensure_alive()
+                data = await session.poll()
+                if data:
+                    await send_slack_notification(data)
+            except Exception as e:
+                logger.error(f"Error during monitor poll: {e}")
+            await asyncio.sleep(interval)
+    finally:
+        await session.close()
+        close_http()
+
 async def test_playwright_bot():
     """
     Test the Playwright-based bot
@@ -725,29 +1041,14 @@ async def test_playwright_bot():
         logger.error("Missing Ringba credentials. Please check .env file.")
         return False
         
-    playwright = None
-    browser = None
+    session = RingbaSession()
     
     try:
         # Setup browser
-        playwright, browser, context, page = await setup_browser()
-        
-        # Login to Ringba
-        login_success = await login_to_ringba(page)
+        await session.start()
         
-        if not login_success:
-            logger.error("Login failed")
-            return False
-            
-        # Navigate to Reporting
-        reporting_success = await navigate_to_reporting(page)
-        
-        if not reporting_success:
-            logger.error("Failed to navigate to Reporting tab")
-            return False
-            
-        # Extract data
-        data = await extract_target_rpc_data(page)
+        # Login, navigate to Reporting and extract every row
+        data = await session.poll(threshold=None)
         
         if not data:
             logger.error("No data extracted")
@@ -759,7 +1060,7 @@ async def test_playwright_bot():
             print(f"• {item['Target']}: ${item['RPC']}")
             
         # Filter for low RPC
-        low_rpc_data = [item for item in data if item["RPC"] < RPC_THRESHOLD]
+        low_rpc_data = low_rpc_rows(data)
         
         if low_rpc_data:
             print(f"\nFound {len(low_rpc_data)} targets with RPC below ${RPC_THRESHOLD}")
@@ -782,10 +1083,8 @@ async def test_playwright_bot():
         
     finally:
         # Clean up
-        if browser:
-            await browser.close()
-        if playwright:
-            await playwright.stop()
+        await session.close()
+        close_http()
 
 async def main():
     print("=== PLAYWRIGHT BOT TEST ===")
@@ -802,4 +1101,15 @@ async def main():
         print("Please check the logs and screenshots for more details.")
 
 if __name__ == "__main__":
-    asyncio.run(main()) 
\ No newline at end of file
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        handlers=[
+            logging.StreamHandler(),
+            RotatingFileHandler("playwright_bot.log", maxBytes=10_000_000, backupCount=3)
+        ]
+    )
+    if "--monitor" in sys.argv:
+        asyncio.run(run_monitor())
+    else:
+        asyncio.run(main()) 
\ No newline at end of file
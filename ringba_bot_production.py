@@ -19,20 +19,16 @@ import os
 import time
 import logging
 import asyncio
-import random
 import schedule
 from datetime import datetime
 import pytz
 import json
-import sys
+import csv
+import hashlib
+import re
 from dotenv import load_dotenv
 import threading
-from http.server import HTTPServer, BaseHTTPRequestHandler
-import pandas as pd
-import platform
-import psutil
-from playwright.async_api import async_playwright
-from supabase import create_client, Client
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
 
 # Configure logging
 logging.basicConfig(
@@ -40,7 +36,7 @@ logging.basicConfig(
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
     handlers=[
         logging.StreamHandler(),
-        logging.FileHandler("ringba_bot.log")
+        logging.FileHandler("ringba_bot_production.log")
     ]
 )
 logger = logging.getLogger(__name__)
@@ -48,248 +44,252 @@ logger = logging.getLogger(__name__)
 # Load environment variables
 load_dotenv()
 
-# Ensure required packages are installed
-def ensure_packages_installed():
-    """Ensure all required packages are installed"""
-    try:
-        import pandas
-    except ImportError:
-        logger.info("Installing pandas...")
-        import subprocess
-        subprocess.check_call([sys.executable, "-m", "pip", "install", "pandas"])
-        import pandas
-    
-    try:
-        from playwright.async_api import async_playwright
-    except ImportError:
-        logger.info("Installing playwright...")
-        import subprocess
-        subprocess.check_call([sys.executable, "-m", "pip", "install", "playwright"])
-        subprocess.check_call([sys.executable, "-m", "playwright", "install", "chromium"])
-        from playwright.async_api import async_playwright
-
-# Run package check at startup
-ensure_packages_installed()
-
-# Health check endpoint for Render.com
-class RequestHandler(BaseHTTPRequestHandler):
-    def do_GET(self):
-        if self.path == "/":
-            self.send_response(200)
-            self.send_header("Content-type", "text/html")
-            self.end_headers()
-            
-            # Create HTML status page with last run result
-            html = """
-            <!DOCTYPE html>
-            <html>
-            <head>
-                <title>Ringba Bot Status</title>
-                <style>
-                    body { font-family: Arial, sans-serif; margin: 20px; background-color: #f5f5f5; }
-                    .container { max-width: 800px; margin: 0 auto; background-color: white; padding: 20px; border-radius: 5px; box-shadow: 0 2px 5px rgba(0,0,0,0.1); }
-                    h1 { color: #333; }
-                    .success { color: green; }
-                    .error { color: red; }
-                    .warning { color: orange; }
-                    .info-box { background-color: #f0f0f0; padding: 15px; border-radius: 5px; margin: 15px 0; }
-                    .button { display: inline-block; background-color: #4CAF50; color: white; padding: 10px 15px; text-decoration: none; border-radius: 4px; margin-top: 20px; }
-                    table { width: 100%; border-collapse: collapse; }
-                    th, td { padding: 8px; text-align: left; border-bottom: 1px solid #ddd; }
-                    th { background-color: #f2f2f2; }
-                </style>
-            </head>
-            <body>
-                <div class="container">
-                    <h1>Ringba Bot Status</h1>
+# Static pieces of the status page, built once at import
+STATUS_PAGE_HEAD = """
+    <!DOCTYPE html>
+    <html>
+    <head>
+        <title>Ringba Bot Status</title>
+        <style>
+            body { font-family: Arial, sans-serif; margin: 20px; background-color: #f5f5f5; }
+            .container { max-width: 800px; margin: 0 auto; background-color: white; padding: 20px; border-radius: 5px; box-shadow: 0 2px 5px rgba(0,0,0,0.1); }
+            h1 { color: #333; }
+            .success { color: green; }
+            .error { color: red; }
+            .warning { color: orange; }
+            .info-box { background-color: #f0f0f0; padding: 15px; border-radius: 5px; margin: 15px 0; }
+            .button { display: inline-block; background-color: #4CAF50; color: white; padding: 10px 15px; text-decoration: none; border-radius: 4px; margin-top: 20px; }
+            table { width: 100%; border-collapse: collapse; }
+            th, td { padding: 8px; text-align: left; border-bottom: 1px solid #ddd; }
+            th { background-color: #f2f2f2; }
+        </style>
+    </head>
+    <body>
+        <div class="container">
+            <h1>Ringba Bot Status</h1>
+    """
+STATUS_PAGE_FOOT = """
+            <a href="/run" class="button">Run Check Now</a>
+        </div>
+    </body>
+    </html>
+    """
+STATUS_NO_DATA = """
+        <h2 class="warning">No Data Available</h2>
+        <p>The bot has not completed any runs yet.</p>
+        """
+REPORT_TYPE_COMPARATIVE = """
+            <p><strong>Report Type:</strong> <span class="success">Comparative Report</span></p>
             """
-            
-            if last_run_result:
-                if last_run_result.get("success"):
-                    status_class = "success"
-                    status_text = "Success"
-                else:
-                    status_class = "error"
-                    status_text = "Error"
-                    
-                html += f"""
-                    <h2>Last Run Status: <span class="{status_class}">{status_text}</span></h2>
-                    <p>Last run: {last_run_result.get("timestamp", "Unknown")}</p>
+REPORT_TYPE_STANDARD = """
+            <p><strong>Report Type:</strong> Standard Report</p>
+            """
+REPORT_TABLE_HEAD = """
+                <div class="info-box">
+                    <h3 class="success">📊 {title} - {count} targets</h3>
+                    <table>
+                        <tr>
+                            <th>Target</th>
+                            <th>{rpc_heading}</th>
+                            <th>Incoming</th>
+                            <th>Converted</th>
+                            <th>Status</th>
+                        </tr>
                 """
+REPORT_TABLE_FOOT = """
+            </table>
+            </div>
+            """
+ENV_TABLE_HEAD = """
+            <h3>Environment Information</h3>
+            <table>
+                <tr>
+                    <th>Metric</th>
+                    <th>Value</th>
+                </tr>
+            """
+ENV_TABLE_FOOT = """
+            </table>
+            """
+
+def render_status_page(result):
+    """
+    Render the HTML status page for a run result
+    
+    Args:
+        result (dict): last_run_result, or None before the first run
+        
+    Returns:
+        str: The full HTML document
+    """
+    # Collect the pieces and join once at the end
+    html_parts = [STATUS_PAGE_HEAD]
+    
+    if result:
+        if result.get("success"):
+            status_class = "success"
+            status_text = "Success"
+        else:
+            status_class = "error"
+            status_text = "Error"
+            
+        html_parts.append(f"""
+            <h2>Last Run Status: <span class="{status_class}">{status_text}</span></h2>
+            <p>Last run: {result.get("timestamp", "Unknown")}</p>
+        """)
+        
+        # Add report type (comparative or standard)
+        if result.get("is_comparative", False):
+            html_parts.append(REPORT_TYPE_COMPARATIVE)
+        else:
+            html_parts.append(REPORT_TYPE_STANDARD)
+        
+        if result.get("success"):
+            targets_displayed = result.get("targets_displayed", [])
+            threshold = result.get("threshold", 12.0)
+            is_comparative = result.get("is_comparative", False)
+            rows = []
+            
+            # Different table structure for comparative reports
+            if is_comparative:
+                html_parts.append(REPORT_TABLE_HEAD.format(
+                    title="Ringba Comparative Report", count=len(targets_displayed), rpc_heading="RPC"))
                 
-                # Add report type (comparative or standard)
-                if last_run_result.get("is_comparative", False):
-                    html += f"""
-                    <p><strong>Report Type:</strong> <span class="success">Comparative Report</span></p>
-                    """
-                else:
-                    html += f"""
-                    <p><strong>Report Type:</strong> Standard Report</p>
-                    """
+                # Pre-sorted by RPC percentage change (largest negative first) when the run finished
+                sorted_targets = result.get("sorted_targets_comparative", [])
                 
-                if last_run_result.get("success"):
-                    target_rpc_data = last_run_result.get("target_rpc_data", [])
-                    targets_displayed = last_run_result.get("targets_displayed", [])
-                    threshold = last_run_result.get("threshold", 12.0)
-                    is_comparative = last_run_result.get("is_comparative", False)
-                    
-                    # Different table structure for comparative reports
-                    if is_comparative:
-                        html += f"""
-                        <div class="info-box">
-                            <h3 class="success">📊 Ringba Comparative Report - {len(targets_displayed)} targets</h3>
-                            <table>
-                                <tr>
-                                    <th>Target</th>
-                                    <th>RPC</th>
-                                    <th>Incoming</th>
-                                    <th>Converted</th>
-                                    <th>Status</th>
-                                </tr>
-                        """
-                        
-                        # Sort by RPC percentage change (largest negative first)
-                        sorted_targets = sorted(
-                            [t for t in targets_displayed if "RPC_pct" in t and t["RPC_pct"] is not None],
-                            key=lambda x: x["RPC_pct"]
-                        )
-                        
-                        for target in sorted_targets[:50]:  # Limit to first 50 targets
-                            target_name = target.get("Target", "Unknown")
-                            rpc_value = target.get("RPC", 0)
-                            rpc_pct = target.get("RPC_pct", 0)
-                            incoming_count = target.get("Incoming", 0)
-                            incoming_pct = target.get("Incoming_pct", 0)
-                            converted_count = target.get("Converted", 0)
-                            converted_pct = target.get("Converted_pct", 0)
-                            
-                            # Determine status class based on RPC percentage change
-                            if rpc_pct > 5:  # More than 5% increase
-                                status_class = "success"
-                                status_text = "↗️ Improved"
-                            elif rpc_pct < -5:  # More than 5% decrease
-                                status_class = "error"
-                                status_text = "↘️ Decreased"
-                            else:  # Between -5% and 5%
-                                status_class = "warning"
-                                status_text = "→ Stable"
-                            
-                            # Format percentage changes
-                            rpc_pct_str = f"{'+' if rpc_pct > 0 else ''}{rpc_pct:.1f}%"
-                            incoming_pct_str = f"{'+' if incoming_pct > 0 else ''}{incoming_pct:.1f}%"
-                            converted_pct_str = f"{'+' if converted_pct > 0 else ''}{converted_pct:.1f}%"
-                            
-                            html += f"""
-                            <tr>
-                                <td>{target_name}</td>
-                                <td>${rpc_value:.2f} ({rpc_pct_str})</td>
-                                <td>{incoming_count} ({incoming_pct_str})</td>
-                                <td>{converted_count} ({converted_pct_str})</td>
-                                <td class="{status_class}">{status_text}</td>
-                            </tr>
-                            """
-                    else:
-                        # Standard report table
-                        html += f"""
-                        <div class="info-box">
-                            <h3 class="success">📊 Ringba Report - {len(targets_displayed)} targets</h3>
-                            <table>
-                                <tr>
-                                    <th>Target</th>
-                                    <th>RPC Value</th>
-                                    <th>Incoming</th>
-                                    <th>Converted</th>
-                                    <th>Status</th>
-                                </tr>
-                        """
-                        
-                        # Sort by RPC value (lowest first)
-                        sorted_targets = sorted(target_rpc_data, key=lambda x: x['RPC'])
-                        
-                        for target in sorted_targets[:50]:  # Limit to first 50 targets
-                            target_name = target.get("Target", "Unknown")
-                            rpc_value = target.get("RPC", 0)
-                            incoming_count = target.get("Incoming", 0)
-                            converted_count = target.get("Converted", 0)  # Add converted count
-                            is_below = rpc_value < threshold
-                            status_class = "error" if is_below else "success"
-                            status_text = "Below threshold" if is_below else "OK"
-                            
-                            html += f"""
-                            <tr>
-                                <td>{target_name}</td>
-                                <td>${rpc_value:.2f}</td>
-                                <td>{incoming_count}</td>
-                                <td>{converted_count}</td>
-                                <td class="{status_class}">{status_text}</td>
-                            </tr>
-                            """
+                for target in sorted_targets[:50]:  # Limit to first 50 targets
+                    target_name = target.get("Target", "Unknown")
+                    rpc_value = target.get("RPC", 0)
+                    rpc_pct = target.get("RPC_pct", 0)
+                    incoming_count = target.get("Incoming", 0)
+                    incoming_pct = target.get("Incoming_pct", 0)
+                    converted_count = target.get("Converted", 0)
+                    converted_pct = target.get("Converted_pct", 0)
                     
-                    html += """
-                    </table>
-                    </div>
-                    """
-                else:
-                    html += f"""
-                    <div class="info-box error">
-                        <h3>Error Details</h3>
-                        <p>{last_run_result.get("error", "Unknown error")}</p>
-                    </div>
-                    """
-                
-                # Display environment information
-                env_info = last_run_result.get("environment", {})
-                if env_info:
-                    html += """
-                    <h3>Environment Information</h3>
-                    <table>
-                        <tr>
-                            <th>Metric</th>
-                            <th>Value</th>
-                        </tr>
-                    """
+                    # Determine status class based on RPC percentage change
+                    if rpc_pct > 5:  # More than 5% increase
+                        status_class = "success"
+                        status_text = "↗️ Improved"
+                    elif rpc_pct < -5:  # More than 5% decrease
+                        status_class = "error"
+                        status_text = "↘️ Decreased"
+                    else:  # Between -5% and 5%
+                        status_class = "warning"
+                        status_text = "→ Stable"
                     
-                    for key, value in env_info.items():
-                        html += f"""
-                        <tr>
-                            <td>{key}</td>
-                            <td>{value}</td>
-                        </tr>
-                        """
+                    # Format percentage changes
+                    rpc_pct_str = f"{'+' if rpc_pct > 0 else ''}{rpc_pct:.1f}%"
+                    incoming_pct_str = f"{'+' if incoming_pct > 0 else ''}{incoming_pct:.1f}%"
+                    converted_pct_str = f"{'+' if converted_pct > 0 else ''}{converted_pct:.1f}%"
                     
-                    html += """
-                    </table>
-                    """
+                    rows.append(f"""
+                    <tr>
+                        <td>{target_name}</td>
+                        <td>${rpc_value:.2f} ({rpc_pct_str})</td>
+                        <td>{incoming_count} ({incoming_pct_str})</td>
+                        <td>{converted_count} ({converted_pct_str})</td>
+                        <td class="{status_class}">{status_text}</td>
+                    </tr>
+                    """)
             else:
-                html += """
-                <h2 class="warning">No Data Available</h2>
-                <p>The bot has not completed any runs yet.</p>
-                """
-            
-            html += """
-                    <a href="/run" class="button">Run Check Now</a>
-                </div>
-            </body>
-            </html>
-            """
+                # Standard report table
+                html_parts.append(REPORT_TABLE_HEAD.format(
+                    title="Ringba Report", count=len(targets_displayed), rpc_heading="RPC Value"))
+                
+                # Pre-sorted by RPC value (lowest first) when the run finished
+                sorted_targets = result.get("sorted_targets_standard", [])
+                
+                for target in sorted_targets[:50]:  # Limit to first 50 targets
+                    target_name = target.get("Target", "Unknown")
+                    rpc_value = target.get("RPC", 0)
+                    incoming_count = target.get("Incoming", 0)
+                    converted_count = target.get("Converted", 0)  # Add converted count
+                    is_below = rpc_value < threshold
+                    status_class = "error" if is_below else "success"
+                    status_text = "Below threshold" if is_below else "OK"
+                    
+                    rows.append(f"""
+                    <tr>
+                        <td>{target_name}</td>
+                        <td>${rpc_value:.2f}</td>
+                        <td>{incoming_count}</td>
+                        <td>{converted_count}</td>
+                        <td class="{status_class}">{status_text}</td>
+                    </tr>
+                    """)
+            
+            html_parts.append("".join(rows))
+            html_parts.append(REPORT_TABLE_FOOT)
+        else:
+            html_parts.append(f"""
+            <div class="info-box error">
+                <h3>Error Details</h3>
+                <p>{result.get("error", "Unknown error")}</p>
+            </div>
+            """)
+        
+        # Display environment information
+        env_info = result.get("environment", {})
+        if env_info:
+            html_parts.append(ENV_TABLE_HEAD)
+            html_parts.append("".join(f"""
+                <tr>
+                    <td>{key}</td>
+                    <td>{value}</td>
+                </tr>
+                """ for key, value in env_info.items()))
+            html_parts.append(ENV_TABLE_FOOT)
+    else:
+        html_parts.append(STATUS_NO_DATA)
+    
+    html_parts.append(STATUS_PAGE_FOOT)
+    return "".join(html_parts)
+
+# Health check endpoint for Render.com
+class RequestHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path == "/":
+            # Render once per run result; later requests reuse the encoded page
+            with _status_lock:
+                body = _status_html_cache["bytes"]
+                if body is None:
+                    body = render_status_page(last_run_result).encode()
+                    _status_html_cache["bytes"] = body
             
-            self.wfile.write(html.encode())
+            self.send_response(200)
+            self.send_header("Content-type", "text/html")
+            self.send_header("Content-Length", str(len(body)))
+            self.send_header("Cache-Control", "max-age=30")
+            self.end_headers()
+            self.wfile.write(body)
         
         elif self.path == "/health":
             self.send_response(200)
             self.send_header("Content-type", "application/json")
             self.end_headers()
             
+            # Results are swapped whole, never mutated, so one read is a consistent snapshot
+            result = last_run_result or {}
             health_status = {
                 "status": "healthy",
-                "lastRun": last_run_result.get("timestamp", "Never"),
-                "success": last_run_result.get("success", False),
-                "isComparative": last_run_result.get("is_comparative", False)
+                "lastRun": result.get("timestamp", "Never"),
+                "success": result.get("success", False),
+                "isComparative": result.get("is_comparative", False)
             }
             
             self.wfile.write(json.dumps(health_status).encode())
         
         elif self.path == "/run":
+            # Collapse repeated clicks into the run that is already in flight
+            if _run_lock.locked():
+                self.send_response(429)
+                self.send_header("Content-type", "text/plain")
+                self.send_header("Retry-After", "60")
+                self.end_headers()
+                self.wfile.write(b"A check is already running")
+                return
+            
             self.send_response(200)
             self.send_header("Content-type", "text/html")
             self.end_headers()
@@ -332,7 +332,9 @@ class RequestHandler(BaseHTTPRequestHandler):
 def start_health_check_server():
     """Start a simple HTTP server for health checks"""
     port = int(os.environ.get('PORT', 10000))  # Render.com sets the PORT environment variable
-    server = HTTPServer(('0.0.0.0', port), RequestHandler)
+    # Threaded so a slow request never holds up Render's health probe
+    server = ThreadingHTTPServer(('0.0.0.0', port), RequestHandler)
+    server.daemon_threads = True
     logger.info(f"Starting health check server on port {port}")
     server.serve_forever()
 
@@ -344,91 +346,330 @@ SLACK_WEBHOOK_URL = os.getenv("SLACK_WEBHOOK_URL")
 RPC_THRESHOLD = 0.0  # No threshold filtering - show all targets
 DATA_STORAGE_FILE = "ringba_report_data.json"  # File to store previous run data
 
+# Cell values pandas used to read as NaN; kept so blank rows are still skipped
+CSV_MISSING_VALUES = {"", "nan", "n/a", "na", "null", "none"}
+
+# Currency signs, thousands separators and spaces stripped from numeric cells in one pass
+CSV_NUMBER_JUNK_RE = re.compile(r"[$,\s]")
+
+# Column names that hold the incoming call count
+INCOMING_COLUMNS = {'incoming', 'calls', 'call count', 'inbound', 'inbound calls'}
+
+# Debug screenshots are off in production; set DEBUG_SCREENSHOTS=1 to capture them
+DEBUG_SCREENSHOTS = os.getenv("DEBUG_SCREENSHOTS", "0") == "1"
+
+# Saved login cookies/localStorage, reused by new contexts until they are too old
+STATE_FILE = "ringba_state.json"
+STATE_MAX_AGE_HOURS = float(os.getenv("RINGBA_STATE_MAX_AGE_HOURS", "12"))
+
+# Call logs report page, and the route it must settle on once loaded
+CALL_LOGS_REPORT_URL = "https://app.ringba.com/#/dashboard/call-logs/report/new"
+CALL_LOGS_REPORT_RE = re.compile(r"call-logs/report")
+
+# Requests the bot never needs: heavy resource types and analytics beacons
+BLOCKED_RESOURCE_TYPES = frozenset({"image", "font", "media"})
+BLOCKED_URL_PARTS = ("google-analytics", "googletagmanager", "segment.io", "segment.com", "hotjar", "doubleclick")
+
+# Login link on the marketing site, tried as one union locator
+LOGIN_LINK_SELECTORS = (
+    "a:has-text('Login')",
+    "a[href*='login']",
+    "button:has-text('Login')",
+    ".menu a[href*='login']",
+)
+LOGIN_LINK_UNION = ", ".join(LOGIN_LINK_SELECTORS)
+
+# Email field on the login form
+EMAIL_FIELD_SELECTORS = (
+    "input[type='email']",
+    "#email",
+    "input[name='email']",
+    "input[placeholder*='email' i]",
+    "form input[type='text']:first-child",
+)
+EMAIL_FIELD_UNION = ", ".join(EMAIL_FIELD_SELECTORS)
+
+# EXPORT CSV button on the call logs report. A union locator returns the first match in
+# DOM order, so the exact selectors are tried on their own before the looser ones
+EXPORT_BUTTON_EXACT_SELECTORS = (
+    "button:has-text('EXPORT CSV')",
+    "button:has-text('Export CSV')",
+    ":text('EXPORT CSV')",
+    ":text('Export CSV')",
+    "button.export-csv",
+    ".export-csv",
+)
+EXPORT_BUTTON_LOOSE_SELECTORS = (
+    "button:has-text('Export')",
+    "button:has-text('CSV')",
+    "a:has-text('Export')",
+    "a:has-text('CSV')",
+    "[aria-label*='export' i]",
+    "[aria-label*='csv' i]",
+    "[title*='export' i]",
+    "[title*='csv' i]",
+)
+EXPORT_BUTTON_EXACT_UNION = ", ".join(EXPORT_BUTTON_EXACT_SELECTORS)
+EXPORT_BUTTON_LOOSE_UNION = ", ".join(EXPORT_BUTTON_LOOSE_SELECTORS)
+
+# Export button selectors found by the fallback searches, keyed by page URL and kept across restarts
+SELECTOR_CACHE_FILE = "selector_cache.json"
+_selector_cache = None
+
+# Fallback search for the export button: candidate elements and the text that marks one
+EXPORT_CANDIDATES = "button, a.btn, .btn, a[role='button']"
+EXPORT_TEXT_RE = re.compile(r"export|csv|download", re.I)
+
 # Global variable to store the last run result
 last_run_result = None
 
-# Initialize playwright
-playwright = None
+# Encoded status page for the current last_run_result; rebuilt on the next GET after a run
+_status_html_cache = {"bytes": None}
+
+# Guards last_run_result and the page cache across the HTTP server's request threads
+_status_lock = threading.Lock()
 
-# Random delay function for human-like behavior
-def random_sleep_async(min_seconds=0.5, max_seconds=2.0):
-    """Generate a random sleep duration for human-like behavior"""
-    return random.uniform(min_seconds, max_seconds)
+# Digest of the last blob written to DATA_STORAGE_FILE, so identical results aren't rewritten
+_last_storage_hash = None
 
-async def setup_browser(headless=True, retry_count=3):
+def save_last_run_result(result):
     """
-    Set up and configure Playwright browser with retry mechanism
+    Persist a run result to DATA_STORAGE_FILE, skipping the write if nothing changed
+    
+    The file is written to a temporary path and renamed so a crash never leaves it half-written.
     """
-    for attempt in range(retry_count):
-        try:
-            logger.info(f"Starting Playwright (attempt {attempt+1}/{retry_count})...")
-            playwright = await async_playwright().start()
-            
-            # Use chromium for best compatibility
-            browser = await playwright.chromium.launch(
-                headless=headless,  # Use headless=True for production
-                args=[
-                    "--disable-features=BlinkGenPropertyTrees",
-                    "--disable-blink-features=AutomationControlled",
-                    "--disable-dev-shm-usage",  # Helps with memory issues in containerized environments
-                    "--no-sandbox",  # Required for running in containers
-                    "--disable-setuid-sandbox",
-                    "--single-process",  # Use single process to reduce memory usage
-                ]
-            )
-            
-            # Create a context with specific viewport and user agent
-            context = await browser.new_context(
-                viewport={"width": 1366, "height": 768},  # Reduced size for less memory usage
-                user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/134.0.0.0 Safari/537.36"
-            )
+    global _last_storage_hash
+    try:
+        blob = json.dumps(result, separators=(",", ":")).encode()
+        digest = hashlib.blake2b(blob, digest_size=16).digest()
+        if digest == _last_storage_hash:
+            return
+        tmp_path = DATA_STORAGE_FILE + ".tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(blob)
+        os.replace(tmp_path, DATA_STORAGE_FILE)
+        _last_storage_hash = digest
+    except Exception as e:
+        logger.warning(f"Could not persist last run result: {e}")
+
+def load_last_run_result():
+    """
+    Restore the last run result saved by a previous process, if any
+    """
+    global _last_storage_hash
+    try:
+        with open(DATA_STORAGE_FILE, "rb") as f:
+            blob = f.read()
+        result = json.loads(blob)
+    except FileNotFoundError:
+        return
+    except Exception as e:
+        logger.warning(f"Could not load last run result: {e}")
+        return
+    _last_storage_hash = hashlib.blake2b(blob, digest_size=16).digest()
+    set_last_run_result(result, persist=False)
+    logger.info(f"Restored last run result from {result.get('timestamp', 'unknown time')}")
+
+def set_last_run_result(result, persist=True):
+    """Publish a new run result and invalidate the cached status page"""
+    global last_run_result
+    with _status_lock:
+        last_run_result = result
+        _status_html_cache["bytes"] = None
+    if persist:
+        save_last_run_result(result)
+
+# Process-wide Playwright and browser, launched once and shared by every check
+_browser_lock = asyncio.Lock()
+_browser_singleton = {"pw": None, "browser": None}
+
+# Event loop that owns the shared browser; scheduled and /run checks are submitted to it
+_bot_loop = None
+_bot_loop_lock = threading.Lock()
+
+# Held for the duration of a check so overlapping triggers don't launch a second run
+_run_lock = threading.Lock()
+
+async def debug_screenshot(page, name):
+    """
+    Save a low-quality viewport JPEG when DEBUG_SCREENSHOTS is enabled
+    
+    Args:
+        page: Playwright page to capture
+        name: File name without extension
+    """
+    if not DEBUG_SCREENSHOTS:
+        return
+    try:
+        await page.screenshot(path=f"{name}.jpg", full_page=False, type="jpeg", quality=40)
+    except Exception as ss_error:
+        logger.warning(f"Could not save screenshot {name}: {ss_error}")
+
+async def wait_until_idle(page, timeout=10000):
+    """
+    Wait for the page's network to go idle, returning early once it is ready
+    
+    A timeout is not an error: the Ringba app can keep polling in the background.
+    """
+    try:
+        await page.wait_for_load_state("networkidle", timeout=timeout)
+    except Exception:
+        logger.debug("Network did not go idle, continuing")
+
+async def get_or_create_browser(headless=True, retry_count=3):
+    """
+    Return the shared Chromium instance, launching it on first use or if it has died
+    """
+    async with _browser_lock:
+        browser = _browser_singleton["browser"]
+        if browser is not None and browser.is_connected():
+            return browser
+        
+        if browser is not None:
+            logger.warning("Shared browser is no longer connected, relaunching")
+            await close_browser_unlocked()
+        
+        # Imported here so the health check server starts without loading Playwright
+        from playwright.async_api import async_playwright
+        
+        for attempt in range(retry_count):
+            try:
+                logger.info(f"Starting Playwright (attempt {attempt+1}/{retry_count})...")
+                playwright = await async_playwright().start()
+                _browser_singleton["pw"] = playwright
+                
+                # Use chromium for best compatibility
+                browser = await playwright.chromium.launch(
+                    headless=headless,  # Use headless=True for production
+                    args=[
+                        "--disable-features=BlinkGenPropertyTrees",
+                        "--disable-blink-features=AutomationControlled",
+                        "--disable-dev-shm-usage",  # Helps with memory issues in containerized environments
+                        "--no-sandbox",  # Required for running in containers
+                        "--disable-setuid-sandbox",
+                    ]
+                )
+                _browser_singleton["browser"] = browser
+                logger.info("Playwright browser launched")
+                return browser
             
-            # Add script to hide automation
-            await context.add_init_script("""
-                Object.defineProperty(navigator, 'webdriver', { get: () => undefined });
+            except Exception as e:
+                logger.error(f"Error setting up Playwright (attempt {attempt+1}/{retry_count}): {e}")
+                await close_browser_unlocked()
                 
-                // Overwrite plugins
-                Object.defineProperty(navigator, 'plugins', {
-                    get: () => {
-                        return {
-                            length: 5,
-                            item: () => null,
-                            refresh: () => {},
-                            namedItem: () => null,
-                            0: {name: 'Chrome PDF Plugin'},
-                            1: {name: 'Chrome PDF Viewer'},
-                            2: {name: 'Native Client'},
-                            3: {name: 'Microsoft Edge PDF Plugin'},
-                            4: {name: 'Microsoft Edge PDF Viewer'}
-                        };
-                    }
-                });
+                # Last attempt, raise the error
+                if attempt == retry_count - 1:
+                    raise
                 
-                // Add languages
-                Object.defineProperty(navigator, 'languages', {
-                    get: () => ['en-US', 'en', 'es']
-                });
-            """)
-            
-            # Create a new page
-            page = await context.new_page()
-            
-            # Add event listeners for potential errors
-            page.on("crash", lambda: logger.error("Page crashed"))
-            page.on("close", lambda: logger.warning("Page was closed"))
-            
-            logger.info("Playwright browser setup complete")
-            return playwright, browser, context, page
+                # Wait before retrying
+                await asyncio.sleep(3)
+
+async def close_browser_unlocked():
+    """Close the shared browser and stop Playwright; caller must hold _browser_lock"""
+    browser, playwright = _browser_singleton["browser"], _browser_singleton["pw"]
+    _browser_singleton["browser"] = _browser_singleton["pw"] = None
+    try:
+        if browser is not None:
+            await browser.close()
+    except Exception as e:
+        logger.warning(f"Error closing browser: {e}")
+    try:
+        if playwright is not None:
+            await playwright.stop()
+    except Exception as e:
+        logger.warning(f"Error stopping Playwright: {e}")
+
+async def close_browser():
+    """Close the shared browser at process exit"""
+    async with _browser_lock:
+        await close_browser_unlocked()
+
+async def block_unneeded_requests(route):
+    """
+    Abort images, fonts, media and analytics; let everything else through
+    """
+    request = route.request
+    if request.resource_type in BLOCKED_RESOURCE_TYPES or any(part in request.url for part in BLOCKED_URL_PARTS):
+        await route.abort()
+    else:
+        await route.continue_()
+
+def saved_storage_state():
+    """
+    Return the saved login state file if it exists and is fresh enough to reuse
+    
+    Returns:
+        str: Path to the state file, or None to log in from scratch
+    """
+    try:
+        age_hours = (time.time() - os.path.getmtime(STATE_FILE)) / 3600
+    except OSError:
+        return None
+    if age_hours > STATE_MAX_AGE_HOURS:
+        logger.info(f"Saved login state is {age_hours:.1f}h old, logging in again")
+        return None
+    return STATE_FILE
+
+async def setup_browser(headless=True, retry_count=3, storage_state=None):
+    """
+    Open a fresh context and page on the shared browser
+    
+    Args:
+        headless: Launch the shared browser headless if it isn't running yet
+        retry_count: Launch attempts for the shared browser
+        storage_state: Saved login state file to restore into the new context
+    
+    Returns:
+        tuple: (playwright, browser, context, page); close only the context when done
+    """
+    browser = await get_or_create_browser(headless, retry_count)
+    
+    # Create a context with specific viewport and user agent
+    context = await browser.new_context(
+        storage_state=storage_state,
+        viewport={"width": 1366, "height": 768},  # Reduced size for less memory usage
+        user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/134.0.0.0 Safari/537.36"
+    )
+    
+    # Add script to hide automation
+    await context.add_init_script("""
+        Object.defineProperty(navigator, 'webdriver', { get: () => undefined });
         
-        except Exception as e:
-            logger.error(f"Error setting up Playwright (attempt {attempt+1}/{retry_count}): {e}")
-            
-            # Last attempt, raise the error
-            if attempt == retry_count - 1:
-                raise
-            
-            # Wait before retrying
-            await asyncio.sleep(3)
+        // Overwrite plugins
+        Object.defineProperty(navigator, 'plugins', {
+            get: () => {
+                return {
+                    length: 5,
+                    item: () => null,
+                    refresh: () => {},
+                    namedItem: () => null,
+                    0: {name: 'Chrome PDF Plugin'},
+                    1: {name: 'Chrome PDF Viewer'},
+                    2: {name: 'Native Client'},
+                    3: {name: 'Microsoft Edge PDF Plugin'},
+                    4: {name: 'Microsoft Edge PDF Viewer'}
+                };
+            }
+        });
+        
+        // Add languages
+        Object.defineProperty(navigator, 'languages', {
+            get: () => ['en-US', 'en', 'es']
+        });
+    """)
+    
+    # Skip downloads the CSV export never needs; speeds up networkidle and saves memory
+    await context.route("**/*", block_unneeded_requests)
+    
+    # Create a new page
+    page = await context.new_page()
+    
+    # Add event listeners for potential errors
+    page.on("crash", lambda: logger.error("Page crashed"))
+    page.on("close", lambda: logger.warning("Page was closed"))
+    
+    logger.info("Playwright browser setup complete")
+    return _browser_singleton["pw"], browser, context, page
 
 async def login_to_ringba(page):
     """
@@ -440,58 +681,37 @@ async def login_to_ringba(page):
         # First navigate to main Ringba page
         logger.info("Navigating to Ringba main page...")
         await page.goto("https://www.ringba.com/")
-        await asyncio.sleep(random_sleep_async(2, 3))
+        await wait_until_idle(page)
         
         # Look for and click the login button on the main page
-        login_btn_selectors = [
-            "a:has-text('Login')",
-            "a[href*='login']", 
-            "button:has-text('Login')",
-            ".menu a[href*='login']"
-        ]
-        
-        for selector in login_btn_selectors:
-            try:
-                login_btn = await page.wait_for_selector(selector, state="visible", timeout=3000)
-                if login_btn:
-                    logger.info(f"Found login button with selector: {selector}")
-                    await login_btn.click()
-                    logger.info("Clicked login button on main page")
-                    await asyncio.sleep(random_sleep_async(2, 3))
-                    break
-            except Exception:
-                pass
+        # One union locator resolves all alternatives in a single wait
+        try:
+            login_btn = page.locator(LOGIN_LINK_UNION).first
+            await login_btn.wait_for(state="visible", timeout=3000)
+            logger.info("Found login button on main page")
+            await login_btn.click()
+            logger.info("Clicked login button on main page")
+            await wait_until_idle(page)
+        except Exception:
+            pass
         
         # Now we should be on the login page - make sure we have the right URL
         current_url = page.url
         if "login" not in current_url:
             logger.info("Directly navigating to login page...")
             await page.goto("https://app.ringba.com/#/login")
-            await asyncio.sleep(random_sleep_async(2, 3))
-        
-        # Try different selectors for the login form
-        selectors_to_try = [
-            "input[type='email']",
-            "#email", 
-            "input[name='email']", 
-            "input[placeholder*='email' i]",
-            "form input[type='text']:first-child"
-        ]
+            await wait_until_idle(page)
         
         # Try to find the email field
         logger.info("Looking for email field...")
-        email_field = None
-        for selector in selectors_to_try:
-            try:
-                # Use a shorter timeout for each attempt
-                email_field = await page.wait_for_selector(selector, state="visible", timeout=5000)
-                if email_field:
-                    logger.info(f"Found email field with selector: {selector}")
-                    break
-            except Exception:
-                pass
+        email_field = page.locator(EMAIL_FIELD_UNION).first
+        try:
+            await email_field.wait_for(state="visible", timeout=5000)
+            logger.info("Found email field")
+        except Exception:
+            email_field = None
         
-        if not email_field:
+        if email_field is None:
             logger.error("Could not find login form")
             return False
         
@@ -548,164 +768,138 @@ async def navigate_to_reporting(page):
     """
     logger.info("Navigating to call logs report page...")
     
+    from playwright.async_api import Error as PlaywrightError, expect
+    
     try:
-        # First verify browser is usable
-        try:
-            await page.evaluate("1")
-        except Exception as e:
-            logger.error(f"Browser not usable before navigation: {e}")
-            return False
-            
-        # Direct approach with retry mechanism
-        max_attempts = 3
-        for attempt in range(max_attempts):
-            try:
-                logger.info(f"Navigation attempt {attempt+1}/{max_attempts}")
-                
-                # Use longer timeout with domcontentloaded to speed things up
-                await page.goto("https://app.ringba.com/#/dashboard/call-logs/report/new", 
-                               timeout=60000, 
-                               wait_until="domcontentloaded")
-                logger.info("Navigated to call logs report page via direct URL")
-                
-                # Take a screenshot for debugging
-                try:
-                    await page.screenshot(path=f"call_logs_navigation_{attempt+1}.png")
-                except Exception:
-                    pass
-                    
-                # Check if page is responsive
-                try:
-                    await page.evaluate("1")
-                    logger.info("Page is responsive after navigation")
-                    
-                    # Wait a moment for the page to initialize
-                    await asyncio.sleep(5)
-                    
-                    # Success - we've reached the page and it's responsive
-                    return True
-                except Exception as e:
-                    logger.error(f"Page not responsive after navigation attempt {attempt+1}: {e}")
-                    
-                    if attempt < max_attempts - 1:
-                        # Wait before retrying
-                        wait_time = 3 * (attempt + 1)
-                        logger.info(f"Waiting {wait_time}s before retry...")
-                        await asyncio.sleep(wait_time)
-                    else:
-                        return False
-                        
-            except Exception as e:
-                logger.error(f"Navigation attempt {attempt+1} failed: {e}")
-                
-                if attempt < max_attempts - 1:
-                    # Wait before retrying
-                    wait_time = 3 * (attempt + 1)
-                    logger.info(f"Waiting {wait_time}s before retry...")
-                    await asyncio.sleep(wait_time)
-                else:
-                    return False
+        # goto already retries transient connection errors; expect() polls until the SPA settles on the report route
+        await page.goto(CALL_LOGS_REPORT_URL, timeout=90000, wait_until="domcontentloaded")
+        await expect(page).to_have_url(CALL_LOGS_REPORT_RE, timeout=15000)
+        logger.info("Navigated to call logs report page via direct URL")
         
-        # If we get here, all attempts failed
-        logger.error("All navigation attempts failed")
-        return False
+        # Take a screenshot for debugging
+        await debug_screenshot(page, "call_logs_navigation")
+        return True
         
+    except (PlaywrightError, AssertionError) as e:
+        logger.error(f"Navigation to call logs report failed: {e}")
+        return False
     except Exception as e:
         logger.error(f"Error in navigate_to_reporting: {e}")
         return False
 
+async def saved_session_is_valid(page):
+    """
+    Check that a context restored from STATE_FILE is really logged in
+    
+    The report URL is still in the address bar right after goto, before the SPA
+    notices expired cookies and redirects to the login page, so wait for the
+    network to settle and for the export button, which only the logged-in app renders.
+    """
+    await wait_until_idle(page, timeout=30000)
+    if "login" in page.url:
+        return False
+    try:
+        await page.locator(EXPORT_BUTTON_EXACT_UNION).first.wait_for(state="visible", timeout=15000)
+    except Exception:
+        return False
+    return True
+
+def get_selector_cache():
+    """
+    Return the URL -> export button selector cache, loading it from disk on first use
+    """
+    global _selector_cache
+    if _selector_cache is None:
+        try:
+            with open(SELECTOR_CACHE_FILE) as f:
+                _selector_cache = json.load(f)
+        except (FileNotFoundError, ValueError):
+            _selector_cache = {}
+    return _selector_cache
+
+def update_selector_cache(url, selector):
+    """
+    Remember (or, with selector=None, forget) the export button selector for a page URL
+    """
+    cache = get_selector_cache()
+    if selector is None:
+        if cache.pop(url, None) is None:
+            return
+    elif cache.get(url) == selector:
+        return
+    else:
+        cache[url] = selector
+    try:
+        tmp_path = SELECTOR_CACHE_FILE + ".tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(cache, f)
+        os.replace(tmp_path, SELECTOR_CACHE_FILE)
+    except Exception as e:
+        logger.warning(f"Could not save selector cache: {e}")
+
 async def export_and_download_csv(page):
     """
     Find and click the EXPORT CSV button, then download the CSV file with better resilience
     """
     logger.info("Looking for EXPORT CSV button...")
     
+    from playwright.async_api import Error as PlaywrightError
+    
     try:
-        # First verify browser is usable
-        try:
-            await page.evaluate("1")
-        except Exception as e:
-            logger.error(f"Browser not usable before export attempt: {e}")
-            return False
-            
         # First take a screenshot to debug
-        try:
-            await page.screenshot(path="before_export.png")
-        except Exception as ss_error:
-            logger.warning(f"Could not save export screenshot: {ss_error}")
-        
-        # Try multiple selectors for the EXPORT CSV button
-        export_selectors = [
-            "button:has-text('EXPORT CSV')",
-            "button:has-text('Export CSV')",
-            "button:has-text('Export')",
-            "button.export-csv",
-            ".export-csv",
-            "button:has-text('CSV')",
-            "text=EXPORT CSV",
-            "text=Export CSV",
-            "a:has-text('Export')",
-            "a:has-text('CSV')",
-            "[aria-label*='export' i]",
-            "[aria-label*='csv' i]",
-            "[title*='export' i]", 
-            "[title*='csv' i]"
-        ]
+        await debug_screenshot(page, "before_export")
         
+        # A selector that worked on this page before skips the whole search below
+        report_url = page.url
+        found_selector = None
         export_button = None
-        for selector in export_selectors:
+        cached_selector = get_selector_cache().get(report_url)
+        if cached_selector:
             try:
-                # Verify browser is still usable before each selector attempt
-                try:
-                    await page.evaluate("1")
-                except Exception:
-                    logger.error("Browser context closed during export button search")
-                    return False
-                    
-                logger.info(f"Trying to find export button with selector: {selector}")
-                export_button = await page.wait_for_selector(selector, timeout=5000)
-                if export_button:
-                    logger.info(f"Found export button with selector: {selector}")
-                    break
+                export_button = await page.wait_for_selector(cached_selector, state="visible", timeout=3000)
+                # Never click a cached match unless it still reads like an export control
+                if not EXPORT_TEXT_RE.search(await export_button.inner_text()):
+                    raise ValueError("cached match is not an export button")
+                logger.info(f"Found export button with cached selector: {cached_selector}")
             except Exception:
-                pass
-                
+                logger.info("Cached export selector no longer matches, searching again")
+                update_selector_cache(report_url, None)
+                export_button = None
+        
+        # Try multiple selectors for the EXPORT CSV button: the exact ones first, so a looser
+        # match earlier in the DOM can't win, then the loose ones; each group is one union wait
+        for union, timeout in ((EXPORT_BUTTON_EXACT_UNION, 10000), (EXPORT_BUTTON_LOOSE_UNION, 3000)):
+            if export_button:
+                break
+            export_button = page.locator(union).first
+            try:
+                logger.info("Looking for export button with union selector")
+                await export_button.wait_for(state="visible", timeout=timeout)
+                logger.info("Found export button")
+            except Exception:
+                export_button = None
+        
         if not export_button:
             logger.warning("Could not find EXPORT CSV button with selectors")
             # Try more generic selectors
             try:
                 logger.info("Trying to find any export-related element")
-                await page.screenshot(path="export_search.png")
-                
-                # Verify browser is still usable
-                try:
-                    await page.evaluate("1")
-                except Exception:
-                    logger.error("Browser context closed during generic button search")
-                    return False
+                await debug_screenshot(page, "export_search")
                 
-                # Get all buttons on the page
-                buttons = await page.query_selector_all("button, a.btn, .btn, a[role='button']")
+                # Get all buttons and their texts in two calls instead of one per button
+                candidates = page.locator(EXPORT_CANDIDATES)
+                texts = await candidates.all_inner_texts()
+                buttons = await candidates.element_handles()
                 logger.info(f"Found {len(buttons)} potential buttons")
                 
                 # Check each button's text for export-related keywords
-                for button in buttons:
-                    try:
-                        # Check if browser is still alive
-                        try:
-                            await page.evaluate("1")
-                        except Exception:
-                            logger.error("Browser context closed during button text check")
-                            return False
-                            
-                        button_text = await button.inner_text()
-                        logger.info(f"Button text: {button_text}")
-                        if "export" in button_text.lower() or "csv" in button_text.lower() or "download" in button_text.lower():
-                            export_button = button
-                            logger.info(f"Found potential export button with text: {button_text}")
-                            break
-                    except Exception:
-                        pass
+                for button, button_text in zip(buttons, texts):
+                    logger.debug(f"Button text: {button_text}")
+                    if EXPORT_TEXT_RE.search(button_text):
+                        export_button = button
+                        found_selector = f":is({EXPORT_CANDIDATES}):text-is({json.dumps(button_text.strip())})"
+                        logger.info(f"Found potential export button with text: {button_text}")
+                        break
             except Exception as search_error:
                 logger.warning(f"Error searching for buttons: {search_error}")
             
@@ -714,24 +908,15 @@ async def export_and_download_csv(page):
             try:
                 logger.info("Last attempt - trying to find exportable elements")
                 
-                # Verify browser is still usable
-                try:
-                    await page.evaluate("1")
-                except Exception:
-                    logger.error("Browser context closed during last export button search")
-                    return False
-                
                 # Use JavaScript to find clickable elements that might be export buttons
                 clickable_elements = await page.evaluate("""() => {
                     const possibleExportElements = [];
-                    // Find elements with onclick attributes or event listeners
-                    document.querySelectorAll('*').forEach(element => {
+                    // Only visit elements that can be clicked; the tag/role match replaces a computed-style check
+                    document.querySelectorAll('button, a, [role="button"], [onclick], [class*="export"], [class*="download"]').forEach(element => {
                         // Check text content for export/csv related terms
                         const text = element.textContent || '';
-                        if ((text.toLowerCase().includes('export') || text.toLowerCase().includes('csv') || 
-                             text.toLowerCase().includes('download')) && 
-                            (element.tagName === 'BUTTON' || element.tagName === 'A' || 
-                             element.role === 'button' || window.getComputedStyle(element).cursor === 'pointer')) {
+                        const lowered = text.toLowerCase();
+                        if (lowered.includes('export') || lowered.includes('csv') || lowered.includes('download')) {
                             possibleExportElements.push({
                                 tagName: element.tagName,
                                 id: element.id,
@@ -765,18 +950,14 @@ async def export_and_download_csv(page):
                 for element_info in clickable_elements:
                     logger.info(f"Trying potential export element: {element_info}")
                     
-                    # Verify browser is still usable
-                    try:
-                        await page.evaluate("1")
-                    except Exception:
-                        logger.error("Browser context closed during element click attempt")
-                        return False
-                    
                     try:
                         if element_info.get("xpath"):
                             element = await page.wait_for_selector(f"xpath={element_info['xpath']}", timeout=2000)
                             if element:
                                 export_button = element
+                                # Cache by tag and text, not the positional XPath, so layout changes can't retarget it
+                                if element_info.get("text"):
+                                    found_selector = f"{element_info['tagName'].lower()}:has-text({json.dumps(element_info['text'])})"
                                 logger.info(f"Found potential export button with XPath: {element_info['xpath']}")
                                 break
                     except Exception:
@@ -792,89 +973,141 @@ async def export_and_download_csv(page):
         download_path = os.path.join(os.getcwd(), "downloads")
         os.makedirs(download_path, exist_ok=True)
         
-        # Verify browser is still usable before download attempt
-        try:
-            await page.evaluate("1")
-        except Exception:
-            logger.error("Browser context closed before download attempt")
-            return False
-        
-        # Handle the download event
+        # Start waiting for the download before clicking so the event can't be missed
         logger.info("Setting up download handler")
-        
         try:
-            # Try the async with approach first
-            async with page.expect_download(timeout=30000) as download_info:
-                # Check if browser is still usable
-                try:
-                    await page.evaluate("1")
-                except Exception:
-                    logger.error("Browser context closed right before button click")
-                    return False
-                
+            async with page.expect_download(timeout=60000) as download_info:
                 await export_button.click()
                 logger.info("Clicked EXPORT CSV button, waiting for download...")
-                
-                # Wait for the download to complete
-                download = await download_info.value
-                logger.info(f"Download started: {download.suggested_filename}")
-                
-                # Save the downloaded file
-                csv_path = os.path.join(download_path, download.suggested_filename)
-                await download.save_as(csv_path)
-                logger.info(f"Downloaded CSV to: {csv_path}")
-                
-                return csv_path
-        except Exception as download_error:
-            logger.warning(f"First download approach failed: {download_error}")
             
-            # If the first approach fails, try a simpler approach
-            try:
-                logger.info("Trying alternative download approach")
-                
-                # Check if browser is still usable
-                try:
-                    await page.evaluate("1")
-                except Exception:
-                    logger.error("Browser context closed before alternative download attempt")
-                    return False
-                
-                await export_button.click()
-                logger.info("Clicked export button, waiting for download...")
-                
-                # Wait in small increments for the download
-                for _ in range(10):
-                    await asyncio.sleep(1)
-                    
-                    # Check if browser is still alive
-                    try:
-                        await page.evaluate("1")
-                    except Exception:
-                        logger.warning("Browser closed during download wait, but download may have started")
-                        break
-                
-                # Wait a bit longer for download to complete
-                await asyncio.sleep(5)
-                
-                # Check if any files were downloaded
-                import glob
-                downloaded_files = glob.glob(os.path.join(download_path, "*.csv"))
-                
-                if downloaded_files:
-                    latest_file = max(downloaded_files, key=os.path.getctime)
-                    logger.info(f"Found downloaded file: {latest_file}")
-                    return latest_file
-                else:
-                    logger.error("No CSV files found in downloads directory")
-                    return False
-            except Exception as alt_error:
-                logger.error(f"Alternative download approach failed: {alt_error}")
-                return False
+            download = await download_info.value
+            logger.info(f"Download started: {download.suggested_filename}")
+            
+            # Save the downloaded file
+            csv_path = os.path.join(download_path, download.suggested_filename)
+            await download.save_as(csv_path)
+            logger.info(f"Downloaded CSV to: {csv_path}")
+        except PlaywrightError as e:
+            # Covers a closed page/context (TargetClosedError) and the download timing out
+            logger.error(f"Export click or download failed: {e}")
+            update_selector_cache(report_url, None)
+            return False
+        
+        # Remember a selector that needed a fallback search so the next run tries it first
+        if found_selector:
+            update_selector_cache(report_url, found_selector)
+        
+        return csv_path
     
+    except PlaywrightError as e:
+        logger.error(f"Playwright error while looking for the export button: {e}")
+        return False
     except Exception as e:
         logger.error(f"Error downloading CSV: {e}")
         return False
 
+def read_csv_columns(csv_path):
+    """
+    Read just the header row of an exported report
+    
+    Args:
+        csv_path: Path to the downloaded CSV file
+        
+    Returns:
+        List of column names
+    """
+    with open(csv_path, newline='', encoding='utf-8-sig') as f:
+        return next(csv.reader(f), [])
+
+def read_csv_rows(csv_path, usecols):
+    """
+    Load an exported report, keeping only the columns the bot uses
+    
+    Args:
+        csv_path: Path to the downloaded CSV file
+        usecols: Column names to keep; None entries (unresolved optional columns) are ignored
+        
+    Returns:
+        List of row dicts keyed by the kept columns; cells missing from short rows are None
+    """
+    with open(csv_path, newline='', encoding='utf-8-sig') as f:
+        reader = csv.reader(f)
+        header = next(reader, [])
+        positions = [(col, header.index(col)) for col in dict.fromkeys(usecols) if col]
+        return [
+            {col: row[i] if i < len(row) else None for col, i in positions}
+            for row in reader
+        ]
+
+def csv_missing(value):
+    """
+    Check whether a CSV cell is empty or a NaN placeholder
+    """
+    return value is None or value.strip().lower() in CSV_MISSING_VALUES
+
+def csv_number(value):
+    """
+    Parse a CSV cell such as "$1,234.50" to a float
+    
+    Returns:
+        The float value, or None if the cell is missing or not numeric
+    """
+    if csv_missing(value):
+        return None
+    try:
+        return float(CSV_NUMBER_JUNK_RE.sub('', value))
+    except ValueError:
+        return None
+
+def csv_int(value):
+    """
+    Parse a CSV count cell such as "1,234" to an int, defaulting to 0
+    """
+    number = csv_number(value)
+    return int(number) if number is not None else 0
+
+def find_incoming_column(columns):
+    """
+    Find the column holding the incoming call count, or None if the report has none
+    """
+    return next((col for col in columns if col.lower() in INCOMING_COLUMNS), None)
+
+def csv_target_name(target_name):
+    """
+    Label empty or NaN target names - these are typically total/average rows
+    """
+    if csv_missing(target_name):
+        return "Totals (all targets average)"
+    return target_name
+
+def target_records(rows, target_column, rpc_column, incoming_column, converted_column):
+    """
+    Build the Target/RPC/Incoming/Converted records for a parsed report in one pass
+    
+    Args:
+        rows: Row dicts from read_csv_rows, holding at least the columns below
+        target_column: Column holding the target name
+        rpc_column: Column holding the RPC value
+        incoming_column: Column holding the incoming call count, or None
+        converted_column: Column holding the converted count, or None
+        
+    Returns:
+        list: One record per row whose RPC is numeric
+    """
+    records = []
+    for row in rows:
+        # Clean the RPC value (remove $ and commas) and drop rows that are not numeric
+        rpc_value = csv_number(row[rpc_column])
+        if rpc_value is None:
+            continue
+        records.append({
+            'Target': csv_target_name(row[target_column]),
+            'RPC': rpc_value,
+            'Incoming': csv_int(row[incoming_column]) if incoming_column else 0,
+            'Converted': csv_int(row[converted_column]) if converted_column else 0
+        })
+    return records
+
 async def read_csv_data(csv_path):
     """
     Read the downloaded CSV file and extract Target and RPC data
@@ -882,109 +1115,51 @@ async def read_csv_data(csv_path):
     logger.info(f"Reading CSV data from: {csv_path}")
     
     try:
-        import pandas as pd
-        
-        # Read the CSV file
-        df = pd.read_csv(csv_path)
-        logger.info(f"CSV loaded with {len(df)} rows and columns: {', '.join(df.columns)}")
+        # Read the header first; rows are loaded once the needed columns are known
+        columns = read_csv_columns(csv_path)
+        logger.info(f"CSV has columns: {', '.join(columns)}")
         
-        # Look for Target and RPC columns
-        target_column = None
-        rpc_column = None
-        converted_column = None  # Add converted column tracking
+        # Look up columns by lowercased name once instead of rescanning for each one
+        columns_by_name = {column.lower(): column for column in columns}
         
         # Check for exact column matches
-        for column in df.columns:
-            col_lower = column.lower()
-            if col_lower == 'target':
-                target_column = column
-            elif col_lower == 'rpc':
-                rpc_column = column
+        target_column = columns_by_name.get('target')
+        rpc_column = columns_by_name.get('rpc')
         
         # If not found, try partial matches
         if target_column is None:
-            for column in df.columns:
+            for column in columns:
                 if 'target' in column.lower():
                     target_column = column
                     break
                     
         if rpc_column is None:
-            for column in df.columns:
+            for column in columns:
                 if 'rpc' in column.lower():
                     rpc_column = column
                     break
         
-        # Find Converted column - specifically look for exact match first
-        for col in df.columns:
-            if col.lower() == 'converted':
-                converted_column = col
-                logger.info(f"Found Converted column: {converted_column}")
-                break
+        # Find Converted and incoming columns once, before touching any rows
+        converted_column = columns_by_name.get('converted')
+        if converted_column:
+            logger.info(f"Found Converted column: {converted_column}")
+        incoming_column = find_incoming_column(columns)
         
         if target_column is None or rpc_column is None:
-            logger.warning(f"Could not identify Target or RPC columns in: {df.columns}")
+            logger.warning(f"Could not identify Target or RPC columns in: {columns}")
             return []
             
         logger.info(f"Using columns: Target='{target_column}', RPC='{rpc_column}'")
         
-        # Extract the data
-        data = []
-        for _, row in df.iterrows():
-            target_name = row[target_column]
-            rpc_value = row[rpc_column]
-            
-            # Skip empty values
-            if pd.isna(target_name) or pd.isna(rpc_value):
-                continue
-                
-            # Convert RPC to float if it's a string with a dollar sign
-            if isinstance(rpc_value, str):
-                rpc_value = rpc_value.replace('$', '').replace(',', '')
-                try:
-                    rpc_value = float(rpc_value)
-                except ValueError:
-                    logger.warning(f"Could not convert RPC value to float: {rpc_value}")
-                    continue
-            
-            # Try to get incoming count if available
-            incoming_count = 0
-            for col in df.columns:
-                if col.lower() in ['incoming', 'calls', 'call count', 'inbound', 'inbound calls']:
-                    try:
-                        incoming_count = int(row[col])
-                        break
-                    except (ValueError, TypeError):
-                        # Try to convert string to number if needed
-                        try:
-                            val = str(row[col]).replace(',', '')
-                            incoming_count = int(float(val))
-                            break
-                        except:
-                            incoming_count = 0
-            
-            # Get converted value if the column was found
-            converted_value = 0
-            if converted_column and not pd.isna(row[converted_column]):
-                try:
-                    # Convert to integer, handling string with commas
-                    if isinstance(row[converted_column], str):
-                        converted_value = int(float(row[converted_column].replace(',', '')))
-                    else:
-                        converted_value = int(row[converted_column])
-                except (ValueError, TypeError):
-                    logger.warning(f"Could not convert Converted value to integer: {row[converted_column]}")
-                    converted_value = 0
-            
-            # Handle NaN or empty target names - these are typically total/average rows
-            if pd.isna(target_name) or str(target_name).lower() == 'nan' or str(target_name).strip() == '':
-                target_name = "Totals (all targets average)"
-            
-            data.append({
-                'Target': str(target_name),
-                'RPC': float(rpc_value),
-                'Incoming': incoming_count,
-                'Converted': converted_value
-            })
+        # Read the CSV rows, keeping only the resolved columns
+        rows = read_csv_rows(csv_path, [target_column, rpc_column, incoming_column, converted_column])
+        logger.info(f"CSV loaded with {len(rows)} rows")
+        
+        # Extract the data, skipping rows without a target name
+        named_rows = [row for row in rows if not csv_missing(row[target_column])]
+        data = target_records(named_rows, target_column, rpc_column, incoming_column, converted_column)
+        if len(data) < len(named_rows):
+            logger.warning(f"Skipped {len(named_rows) - len(data)} rows with a missing or non-numeric RPC value")
         
         logger.info(f"Extracted {len(data)} rows of Target and RPC data from CSV")
         
@@ -1000,7 +1175,30 @@ async def read_csv_data(csv_path):
 
 SUPABASE_URL = os.getenv("SUPABASE_URL")
 SUPABASE_KEY = os.getenv("SUPABASE_API_KEY")
-supabase: Client = create_client(SUPABASE_URL, SUPABASE_KEY)
+
+# Supabase client, created on first use and reused so its HTTP connection pool survives between runs
+_supabase_client = None
+_supabase_lock = threading.Lock()
+
+def get_supabase_client():
+    """
+    Return the shared Supabase client, creating it on first call
+    
+    Returns:
+        Client: Supabase client for SUPABASE_URL
+    """
+    global _supabase_client
+    with _supabase_lock:
+        if _supabase_client is None:
+            # Imported here so the health check server can bind before the Supabase SDK loads
+            from supabase import create_client
+            
+            _supabase_client = create_client(SUPABASE_URL, SUPABASE_KEY)
+        return _supabase_client
+
+# Previous time-slot reports fetched from Supabase, keyed by (date, time_slot) -> (fetched_at, targets)
+PREVIOUS_REPORT_TTL = 3600
+_previous_report_cache = {}
 
 def get_time_slot(run_time):
     hour = run_time.hour
@@ -1013,7 +1211,7 @@ def get_time_slot(run_time):
         return "4:30PM"
     return f"{hour}:{minute}"
 
-def save_report_data(target_rpc_data, run_time):
+async def save_report_data(target_rpc_data, run_time):
     try:
         run_time_str = run_time.strftime("%Y-%m-%d %H:%M:%S")
         time_slot = get_time_slot(run_time)
@@ -1023,14 +1221,18 @@ def save_report_data(target_rpc_data, run_time):
             "targets": target_rpc_data
         }
         # Upsert (insert or update) the record for this time_slot
-        supabase.table("ringba_reports").upsert(data, on_conflict=["time_slot"]).execute()
+        # supabase-py is synchronous; run it on a worker thread so the bot loop keeps going
+        await asyncio.to_thread(
+            get_supabase_client().table("ringba_reports").upsert(data, on_conflict=["time_slot"]).execute
+        )
+        _previous_report_cache.pop((run_time.date().isoformat(), time_slot), None)
         logger.info(f"Saved report data to Supabase for time slot: {time_slot}")
         return True
     except Exception as e:
         logger.error(f"Error saving data to Supabase: {e}")
         return False
 
-def get_previous_report_data(current_time):
+async def get_previous_report_data(current_time):
     try:
         time_slot = get_time_slot(current_time)
         previous_slot = None
@@ -1039,33 +1241,42 @@ def get_previous_report_data(current_time):
         elif time_slot == "4:30PM":
             previous_slot = "2PM"
         if previous_slot:
-            result = supabase.table("ringba_reports").select("targets").eq("time_slot", previous_slot).execute()
+            # An earlier slot doesn't change once written, so reuse a recent fetch
+            key = (current_time.date().isoformat(), previous_slot)
+            cached = _previous_report_cache.get(key)
+            if cached and time.time() - cached[0] < PREVIOUS_REPORT_TTL:
+                return cached[1]
+            
+            result = await asyncio.to_thread(
+                get_supabase_client().table("ringba_reports").select("targets").eq("time_slot", previous_slot).execute
+            )
             if result.data and len(result.data) > 0:
-                return result.data[0]["targets"]
+                targets = result.data[0]["targets"]
+                _previous_report_cache[key] = (time.time(), targets)
+                return targets
         return None
     except Exception as e:
         logger.error(f"Error retrieving data from Supabase: {e}")
         return None
 
-def calculate_percentage_difference(current_value, previous_value):
+def calculate_percentage_differences(current_values, previous_values):
     """
-    Calculate percentage difference between current and previous values
+    Calculate percentage differences between current and previous values element-wise
     
     Args:
-        current_value: Current numeric value
-        previous_value: Previous numeric value to compare against
+        current_values: NumPy array of current values
+        previous_values: NumPy array of previous values to compare against
     
     Returns:
-        Float representing percentage change (positive for increase, negative for decrease)
+        NumPy array of percentage changes (positive for increase, negative for decrease);
+        a zero previous value gives 0% if the current value is also zero, else 100%
     """
-    if previous_value == 0:
-        # Avoid division by zero
-        if current_value == 0:
-            return 0.0  # No change if both are zero
-        else:
-            return 100.0  # 100% increase if previous was zero
+    import numpy as np
     
-    return ((current_value - previous_value) / previous_value) * 100.0
+    # Division by zero is masked out by the outer where, so silence its warning
+    with np.errstate(divide="ignore", invalid="ignore"):
+        change = (current_values - previous_values) / previous_values * 100.0
+    return np.where(previous_values == 0, np.where(current_values == 0, 0.0, 100.0), change)
 
 def create_comparative_report(current_data, previous_data):
     """
@@ -1084,12 +1295,25 @@ def create_comparative_report(current_data, previous_data):
         logger.warning("No previous data available for comparison")
         return current_data
     
+    import numpy as np
+    
     # Create a lookup dictionary from previous data for faster access
     previous_lookup = {item["Target"]: item for item in previous_data}
+    matches = [previous_lookup.get(item["Target"]) for item in current_data]
+    
+    # Calculate each metric's percentage differences for all targets at once; new targets get NaN
+    count = len(current_data)
+    pct_by_metric = {}
+    for metric in ("RPC", "Incoming", "Converted"):
+        current_values = np.fromiter((item[metric] for item in current_data), dtype=np.float64, count=count)
+        previous_values = np.fromiter(
+            (match[metric] if match else np.nan for match in matches), dtype=np.float64, count=count
+        )
+        pct_by_metric[metric] = calculate_percentage_differences(current_values, previous_values).tolist()
     
     # Create comparative report
     comparative_data = []
-    for current_item in current_data:
+    for i, (current_item, previous_item) in enumerate(zip(current_data, matches)):
         target_name = current_item["Target"]
         
         # Create a new report item
@@ -1102,18 +1326,10 @@ def create_comparative_report(current_data, previous_data):
         }
         
         # Add percentage differences if target was in previous data
-        if target_name in previous_lookup:
-            previous_item = previous_lookup[target_name]
-            
-            # Calculate percentage differences
-            report_item["RPC_pct"] = calculate_percentage_difference(
-                current_item["RPC"], previous_item["RPC"])
-            
-            report_item["Incoming_pct"] = calculate_percentage_difference(
-                current_item["Incoming"], previous_item["Incoming"])
-            
-            report_item["Converted_pct"] = calculate_percentage_difference(
-                current_item["Converted"], previous_item["Converted"])
+        if previous_item is not None:
+            report_item["RPC_pct"] = pct_by_metric["RPC"][i]
+            report_item["Incoming_pct"] = pct_by_metric["Incoming"][i]
+            report_item["Converted_pct"] = pct_by_metric["Converted"][i]
             
             # Also store previous values for reference
             report_item["Previous_RPC"] = previous_item["RPC"]
@@ -1131,6 +1347,68 @@ def create_comparative_report(current_data, previous_data):
     logger.info(f"Created comparative report with {len(comparative_data)} targets")
     return comparative_data
 
+class SlackNotifier:
+    """
+    Post payloads to a Slack webhook through a token bucket, backing off on HTTP 429
+    
+    Args:
+        webhook_url: Slack incoming webhook URL
+        rate: Tokens added per second
+        burst: Maximum number of posts sent back to back
+        max_retries: Attempts after a 429 before giving up
+    """
+    def __init__(self, webhook_url, rate=1.0, burst=5, max_retries=3):
+        self.webhook_url = webhook_url
+        self.rate = rate
+        self.burst = burst
+        self.max_retries = max_retries
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+        self._session = None
+    
+    def _reserve(self):
+        """Take a token and return how long to wait before it may be used"""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            return max(0.0, -self._tokens / self.rate)
+    
+    async def post(self, payload):
+        """
+        Send one payload, waiting for a token first
+        
+        Returns:
+            requests.Response: The last response received from Slack
+        """
+        import requests
+        
+        if self._session is None:
+            self._session = requests.Session()
+        
+        backoff = 1.0
+        for attempt in range(self.max_retries + 1):
+            await asyncio.sleep(self._reserve())
+            response = await asyncio.to_thread(
+                self._session.post, self.webhook_url, json=payload, timeout=(3, 10)
+            )
+            if response.status_code != 429 or attempt == self.max_retries:
+                return response
+            
+            # Honour Slack's Retry-After, doubling our own delay when it is absent
+            try:
+                wait = float(response.headers.get("Retry-After", backoff))
+            except ValueError:
+                wait = backoff
+            logger.warning(f"Slack rate limited the webhook, retrying in {wait}s")
+            await asyncio.sleep(wait)
+            backoff *= 2
+        return response
+
+_slack_notifier = SlackNotifier(SLACK_WEBHOOK_URL)
+
 async def send_slack_notification(message):
     """
     Send Slack notification for low RPC values
@@ -1140,8 +1418,6 @@ async def send_slack_notification(message):
         return False
         
     try:
-        import requests
-        
         # Check if message is too large (Slack has ~4000 char limit)
         if len(message) > 3000:
             logger.info(f"Message length ({len(message)} chars) exceeds recommended size, splitting into smaller messages")
@@ -1161,35 +1437,34 @@ async def send_slack_notification(message):
                 "text": header + f"*Sending data in multiple messages due to size ({len(target_lines)} targets)*"
             }
             
-            response = requests.post(
-                SLACK_WEBHOOK_URL,
-                data=json.dumps(first_payload),
-                headers={"Content-Type": "application/json"}
-            )
+            response = await _slack_notifier.post(first_payload)
             
             if response.status_code != 200:
                 logger.error(f"Failed to send first Slack notification: {response.status_code} {response.text}")
                 return False
                 
-            # Send targets in chunks of 10
+            # Build the target chunks of 10; each is labelled with its range so order can be read off
             chunk_size = 10
+            chunk_payloads = []
             for i in range(0, len(target_lines), chunk_size):
                 chunk = target_lines[i:i + chunk_size]
                 chunk_message = "\n".join(chunk)
                 
                 if chunk_message.strip():  # Only send non-empty chunks
-                    chunk_payload = {
+                    chunk_payloads.append({
                         "text": f"*Targets (continued, {i+1}-{min(i+chunk_size, len(target_lines))} of {len(target_lines)})*\n\n{chunk_message}"
-                    }
-                    
-                    chunk_response = requests.post(
-                        SLACK_WEBHOOK_URL,
-                        data=json.dumps(chunk_payload),
-                        headers={"Content-Type": "application/json"}
-                    )
-                    
-                    if chunk_response.status_code != 200:
-                        logger.error(f"Failed to send chunk Slack notification: {chunk_response.status_code} {chunk_response.text}")
+                    })
+            
+            # The header went out first; the chunks overlap their round trips, paced by the notifier
+            chunk_responses = await asyncio.gather(
+                *(_slack_notifier.post(payload) for payload in chunk_payloads),
+                return_exceptions=True
+            )
+            for chunk_response in chunk_responses:
+                if isinstance(chunk_response, Exception):
+                    logger.error(f"Failed to send chunk Slack notification: {chunk_response}")
+                elif chunk_response.status_code != 200:
+                    logger.error(f"Failed to send chunk Slack notification: {chunk_response.status_code} {chunk_response.text}")
             
             logger.info("Split Slack notifications sent successfully")
             return True
@@ -1202,11 +1477,7 @@ async def send_slack_notification(message):
         
         # Send to Slack
         logger.info("Sending Slack notification")
-        response = requests.post(
-            SLACK_WEBHOOK_URL,
-            data=json.dumps(payload),
-            headers={"Content-Type": "application/json"}
-        )
+        response = await _slack_notifier.post(payload)
         
         if response.status_code == 200:
             logger.info("Slack notification sent successfully")
@@ -1229,47 +1500,69 @@ async def get_csv_values(page=None, start_fresh=False, retry_count=0):
     browser = None
     context = None
     playwright_instance = None
+    on_report_page = False
     
     try:
         if start_fresh or not page:
             logger.info("Starting get_csv_values...")
             logger.info("Creating new browser instance...")
             
+            # Retries start from a clean login in case the saved session is what failed
+            restored_state = saved_storage_state() if retry_count == 0 else None
+            
             # Set up browser with retry mechanism
-            playwright_instance, browser, context, page = await setup_browser(headless=True)
+            playwright_instance, browser, context, page = await setup_browser(headless=True, storage_state=restored_state)
             
-            # Login to Ringba
-            logger.info("Logging in to Ringba...")
-            login_success = await login_to_ringba(page)
+            # A saved session lands straight on the report; fall back to a full login if it has expired
+            on_report_page = (
+                bool(restored_state)
+                and await navigate_to_reporting(page)
+                and await saved_session_is_valid(page)
+            )
+            if on_report_page:
+                logger.info("Reused saved Ringba session, skipping login")
+                login_success = True
+            else:
+                if restored_state:
+                    logger.info("Saved Ringba session has expired, logging in again")
+                # Login to Ringba
+                logger.info("Logging in to Ringba...")
+                login_success = await login_to_ringba(page)
             
             if not login_success:
                 logger.error("Login failed")
                 if retry_count < MAX_RETRIES:
                     logger.info(f"Retrying get_csv_values (attempt {retry_count + 1}/{MAX_RETRIES})...")
-                    if browser:
-                        await browser.close()
+                    if context:
+                        await context.close()
                     return await get_csv_values(page=None, start_fresh=True, retry_count=retry_count + 1)
                 else:
                     logger.error("Max retries reached for login, giving up")
                     return []
             
-            # Take screenshot after successful login
-            try:
-                await page.screenshot(path="after_login.png")
-                logger.info("Saved screenshot after login")
-            except Exception as ss_error:
-                logger.warning(f"Could not save screenshot: {ss_error}")
+            if not on_report_page:
+                # Take screenshot after successful login
+                await debug_screenshot(page, "after_login")
+                
+                # Save the session so the next run's context can skip the login flow
+                try:
+                    await context.storage_state(path=STATE_FILE)
+                except Exception as state_error:
+                    logger.warning(f"Could not save login state: {state_error}")
         
         # Navigate to Reporting tab
-        logger.info("Navigating to reporting page...")
-        navigation_success = await navigate_to_reporting(page)
+        if on_report_page:
+            navigation_success = True
+        else:
+            logger.info("Navigating to reporting page...")
+            navigation_success = await navigate_to_reporting(page)
         
         if not navigation_success:
             logger.error("Failed to navigate to reporting page")
             if retry_count < MAX_RETRIES:
                 logger.info(f"Retrying get_csv_values (attempt {retry_count + 1}/{MAX_RETRIES})...")
-                if browser:
-                    await browser.close()
+                if context:
+                    await context.close()
                 return await get_csv_values(page=None, start_fresh=True, retry_count=retry_count + 1)
             else:
                 logger.error("Max retries reached for navigation, giving up")
@@ -1282,8 +1575,8 @@ async def get_csv_values(page=None, start_fresh=False, retry_count=0):
             logger.error("Failed to export and download CSV")
             if retry_count < MAX_RETRIES:
                 logger.info(f"Retrying get_csv_values (attempt {retry_count + 1}/{MAX_RETRIES})...")
-                if browser:
-                    await browser.close()
+                if context:
+                    await context.close()
                 return await get_csv_values(page=None, start_fresh=True, retry_count=retry_count + 1)
             else:
                 logger.error("Max retries reached for CSV export, giving up")
@@ -1293,45 +1586,41 @@ async def get_csv_values(page=None, start_fresh=False, retry_count=0):
         
         # Process the CSV file to extract RPC values
         try:
-            import pandas as pd
-            
-            # Read the CSV file
-            df = pd.read_csv(csv_path)
-            logger.info(f"CSV loaded with columns: {df.columns.tolist()}")
+            # Read the header first; rows are loaded once the needed columns are known
+            columns = read_csv_columns(csv_path)
+            logger.info(f"CSV loaded with columns: {columns}")
             
             # Look for target column and RPC column
             target_column = None
             rpc_column = None
-            converted_column = None  # Add converted column tracking
             
             # Find target column
-            for col in df.columns:
+            for col in columns:
                 if col.lower() in ['target', 'campaign', 'campaign name', 'name']:
                     target_column = col
                     break
             
             # Find RPC column
-            for col in df.columns:
+            for col in columns:
                 if 'rpc' in col.lower():
                     rpc_column = col
                     logger.info(f"Found RPC column: {rpc_column}")
                     break
                     
-            # Find Converted column - specifically look for exact match first
-            for col in df.columns:
-                if col.lower() == 'converted':
-                    converted_column = col
-                    logger.info(f"Found Converted column: {converted_column}")
-                    break
+            # Find Converted and incoming columns once, before touching any rows
+            converted_column = next((col for col in columns if col.lower() == 'converted'), None)
+            if converted_column:
+                logger.info(f"Found Converted column: {converted_column}")
+            incoming_column = find_incoming_column(columns)
             
             if not target_column:
                 logger.warning("Could not find a target column, using first column")
-                target_column = df.columns[0]
+                target_column = columns[0]
             
             if not rpc_column:
                 logger.warning("Could not find an RPC column, trying alternative column names")
                 # Try common alternative names
-                for col in df.columns:
+                for col in columns:
                     if any(keyword in col.lower() for keyword in ['revenue', 'profit', 'earning', 'value']):
                         rpc_column = col
                         logger.info(f"Using alternative column as RPC: {rpc_column}")
@@ -1341,80 +1630,28 @@ async def get_csv_values(page=None, start_fresh=False, retry_count=0):
                 logger.error("Could not find a usable RPC column in the CSV")
                 if retry_count < MAX_RETRIES:
                     logger.info(f"Retrying get_csv_values (attempt {retry_count + 1}/{MAX_RETRIES})...")
-                    if browser:
-                        await browser.close()
+                    if context:
+                        await context.close()
                     return await get_csv_values(page=None, start_fresh=True, retry_count=retry_count + 1)
                 else:
                     logger.error("Max retries reached, giving up")
                     return []
             
-            # Clean the RPC values (remove $ and commas)
-            if df[rpc_column].dtype == object:  # if string type
-                df[rpc_column] = df[rpc_column].astype(str).str.replace('$', '').str.replace(',', '')
-            
-            # Convert to numeric
-            df[rpc_column] = pd.to_numeric(df[rpc_column], errors='coerce')
-            
-            # Drop NaN values
-            df = df.dropna(subset=[rpc_column])
+            # Create a list of target and RPC data
+            rows = read_csv_rows(csv_path, [target_column, rpc_column, incoming_column, converted_column])
+            target_rpc_data = target_records(rows, target_column, rpc_column, incoming_column, converted_column)
             
-            if df.empty:
+            if not target_rpc_data:
                 logger.error("No valid RPC values found after conversion")
                 if retry_count < MAX_RETRIES:
                     logger.info(f"Retrying get_csv_values (attempt {retry_count + 1}/{MAX_RETRIES})...")
-                    if browser:
-                        await browser.close()
+                    if context:
+                        await context.close()
                     return await get_csv_values(page=None, start_fresh=True, retry_count=retry_count + 1)
                 else:
                     logger.error("Max retries reached, giving up")
                     return []
             
-            # Create a list of target and RPC data
-            target_rpc_data = []
-            for _, row in df.iterrows():
-                target_name = row[target_column]
-                rpc_value = row[rpc_column]
-                
-                # Try to get incoming count if available
-                incoming_count = 0
-                for col in df.columns:
-                    if col.lower() in ['incoming', 'calls', 'call count', 'inbound', 'inbound calls']:
-                        try:
-                            incoming_count = int(row[col])
-                            break
-                        except (ValueError, TypeError):
-                            # Try to convert string to number if needed
-                            try:
-                                val = str(row[col]).replace(',', '')
-                                incoming_count = int(float(val))
-                                break
-                            except:
-                                incoming_count = 0
-                
-                # Get converted value if the column was found
-                converted_value = 0
-                if converted_column and not pd.isna(row[converted_column]):
-                    try:
-                        # Convert to integer, handling string with commas
-                        if isinstance(row[converted_column], str):
-                            converted_value = int(float(row[converted_column].replace(',', '')))
-                        else:
-                            converted_value = int(row[converted_column])
-                    except (ValueError, TypeError):
-                        logger.warning(f"Could not convert Converted value to integer: {row[converted_column]}")
-                        converted_value = 0
-                
-                # Handle NaN or empty target names - these are typically total/average rows
-                if pd.isna(target_name) or str(target_name).lower() == 'nan' or str(target_name).strip() == '':
-                    target_name = "Totals (all targets average)"
-                
-                target_rpc_data.append({
-                    'Target': str(target_name),
-                    'RPC': float(rpc_value),
-                    'Incoming': incoming_count,
-                    'Converted': converted_value
-                })
-            
             logger.info(f"Extracted {len(target_rpc_data)} target RPC values")
             
             # Clean up the CSV file
@@ -1430,8 +1667,8 @@ async def get_csv_values(page=None, start_fresh=False, retry_count=0):
             logger.error(f"Error processing CSV file: {csv_error}")
             if retry_count < MAX_RETRIES:
                 logger.info(f"Retrying get_csv_values (attempt {retry_count + 1}/{MAX_RETRIES})...")
-                if browser:
-                    await browser.close()
+                if context:
+                    await context.close()
                 return await get_csv_values(page=None, start_fresh=True, retry_count=retry_count + 1)
             else:
                 return []
@@ -1441,35 +1678,54 @@ async def get_csv_values(page=None, start_fresh=False, retry_count=0):
         logger.exception(e)
         if retry_count < MAX_RETRIES:
             logger.info(f"Retrying get_csv_values (attempt {retry_count + 1}/{MAX_RETRIES})...")
-            if browser:
-                await browser.close()
+            if context:
+                await context.close()
             return await get_csv_values(page=None, start_fresh=True, retry_count=retry_count + 1)
         else:
             logger.error("Max retries reached, giving up")
             return []
             
     finally:
-        # Close browser if we created it and it's still open
-        if start_fresh and browser:
+        # Close the context if we created it; the shared browser stays up for the next check
+        if start_fresh and context:
             try:
-                await browser.close()
-                logger.info("Browser closed")
+                await context.close()
+                logger.info("Browser context closed")
             except Exception as e:
-                logger.warning(f"Error closing browser: {e}")
+                logger.warning(f"Error closing browser context: {e}")
+
+# Host details that don't change while the process runs, filled in on the first check
+_static_env_info = None
+
+def get_static_env_info():
+    """
+    Return platform and memory details, computed once per process
+    
+    platform.processor() and platform.platform() shell out to uname on Linux, so they are not repeated per run.
+    """
+    global _static_env_info
+    if _static_env_info is None:
+        import platform
+        import psutil
+        
+        _static_env_info = {
+            "platform": platform.platform(),
+            "python_version": platform.python_version(),
+            "hostname": platform.node(),
+            "processor": platform.processor(),
+            "memory": f"{psutil.virtual_memory().total / (1024 * 1024 * 1024):.2f} GB",
+        }
+    return _static_env_info
 
 async def main():
     """
     Main function to get RPC values and send Slack notification
     """
-    global last_run_result
+    import psutil
     
-    # Configure environment information for debugging
+    # Configure environment information for debugging; only the free space changes between runs
     env_info = {
-        "platform": platform.platform(),
-        "python_version": platform.python_version(),
-        "hostname": platform.node(),
-        "processor": platform.processor(),
-        "memory": f"{psutil.virtual_memory().total / (1024 * 1024 * 1024):.2f} GB",
+        **get_static_env_info(),
         "free_memory": f"{psutil.virtual_memory().available / (1024 * 1024 * 1024):.2f} GB",
         "free_disk": f"{psutil.disk_usage('/').free / (1024 * 1024 * 1024):.2f} GB"
     }
@@ -1477,11 +1733,6 @@ async def main():
     logger.info(f"Starting Ringba bot with environment: {env_info}")
     
     try:
-        # Initialize playwright
-        global playwright
-        playwright = await async_playwright().start()
-        logger.info("Playwright initialized")
-        
         # Get RPC values with retries
         logger.info("Getting CSV values...")
         target_rpc_data = await get_csv_values(start_fresh=True)
@@ -1491,12 +1742,12 @@ async def main():
             logger.error(error_message)
             
             # Update last run result
-            last_run_result = {
+            set_last_run_result({
                 "success": False,
                 "error": error_message,
                 "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
                 "environment": env_info
-            }
+            })
             
             # Send error notification to Slack
             await send_slack_notification(
@@ -1525,7 +1776,7 @@ async def main():
         if now.hour == 14 and now.minute < 30:  # 2 PM ET
             logger.info("This is a 2 PM run - creating comparative report vs 10 AM")
             is_comparative_report = True
-            previous_data = get_previous_report_data(now)
+            previous_data = await get_previous_report_data(now)
             if previous_data:
                 report_data = create_comparative_report(target_rpc_data, previous_data)
             else:
@@ -1535,7 +1786,7 @@ async def main():
         elif now.hour == 16 and now.minute >= 30:  # 4:30 PM ET
             logger.info("This is a 4:30 PM run - creating comparative report vs 2 PM")
             is_comparative_report = True
-            previous_data = get_previous_report_data(now)
+            previous_data = await get_previous_report_data(now)
             if previous_data:
                 report_data = create_comparative_report(target_rpc_data, previous_data)
             else:
@@ -1605,34 +1856,41 @@ async def main():
                 message += f"• {item['Target']} - RPC: ${item['RPC']:.2f}, Incoming: {item['Incoming']}, Converted: {item['Converted']}\n"
         
         # Update last run result
-        last_run_result = {
+        set_last_run_result({
             "success": True,
             "target_rpc_data": target_rpc_data,
             "targets_displayed": report_data,
+            # Sorted once here so the status page never re-sorts per request
+            "sorted_targets_standard": sorted(target_rpc_data, key=lambda x: x["RPC"]),
+            "sorted_targets_comparative": sorted(
+                [t for t in report_data if t.get("RPC_pct") is not None],
+                key=lambda x: x["RPC_pct"]
+            ),
             "threshold": threshold,
             "timestamp": now.strftime("%Y-%m-%d %H:%M:%S"),
             "environment": env_info,
             "is_comparative": is_comparative_report
-        }
+        })
         
         # Send notification to Slack
+        # Send the Slack notification and save the data for future comparison concurrently
         logger.info(f"Sending Slack notification for {len(report_data)} targets")
-        await send_slack_notification(message)
-        
-        # Save the data for future comparison
-        save_report_data(target_rpc_data, now)
+        await asyncio.gather(
+            send_slack_notification(message),
+            save_report_data(target_rpc_data, now)
+        )
         
     except Exception as e:
         logger.error(f"Error in main function: {e}")
         logger.exception(e)
         
         # Update last run result
-        last_run_result = {
+        set_last_run_result({
             "success": False,
             "error": str(e),
             "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
             "environment": env_info
-        }
+        })
         
         # Send error notification to Slack
         await send_slack_notification(
@@ -1641,22 +1899,38 @@ async def main():
             f"*Time*: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
             f"*Environment*: Running on {env_info['platform']} with {env_info['free_memory']} free memory"
         )
-    
-    finally:
-        # Clean up playwright
-        if 'playwright' in globals():
-            try:
-                await playwright.stop()
-                logger.info("Playwright stopped")
-            except Exception as e:
-                logger.warning(f"Error stopping Playwright: {e}")
+
+
+def get_bot_loop():
+    """
+    Return the long-lived event loop that owns the shared browser, starting it on first use
+    """
+    global _bot_loop
+    with _bot_loop_lock:
+        if _bot_loop is None:
+            _bot_loop = asyncio.new_event_loop()
+            threading.Thread(target=_bot_loop.run_forever, name="ringba-bot-loop", daemon=True).start()
+        return _bot_loop
 
 def run_check():
     """
     Wrapper to run the async check function
+    
+    Every check runs on the same event loop so the shared browser can be reused.
+    A trigger that arrives while a check is running is skipped.
+    
+    Returns:
+        bool: False if the check was skipped because one was already running
     """
-    logger.info("Scheduled check triggered")
-    asyncio.run(main())
+    if not _run_lock.acquire(blocking=False):
+        logger.info("Check already in progress, skipping this trigger")
+        return False
+    try:
+        logger.info("Scheduled check triggered")
+        asyncio.run_coroutine_threadsafe(main(), get_bot_loop()).result()
+        return True
+    finally:
+        _run_lock.release()
 
 def setup_schedule():
     """
@@ -1694,6 +1968,9 @@ async def check_rpc_values():
 # Run the first check and then schedule periodic checks
 if __name__ == "__main__":
     try:
+        # Show the previous process's result on the status page until the first check finishes
+        load_last_run_result()
+        
         # Start health check server in a separate thread
         logger.info("Starting health check server thread...")
         health_thread = threading.Thread(target=start_health_check_server, daemon=True)
@@ -1701,7 +1978,7 @@ if __name__ == "__main__":
         
         # Run the first check
         logger.info("Running initial RPC check...")
-        asyncio.run(main())
+        run_check()
         
         # Set up schedule for periodic checks
         setup_schedule()
@@ -24,29 +24,33 @@ os.makedirs(os.path.join(os.getcwd(), "downloads"), exist_ok=True)
 
 # Import after ensuring directories exist
 try:
-    from ringba_bot_production import main, ensure_packages_installed
+    from ringba_bot_production import main, close_browser
     logger.info("Successfully imported main function")
     check_rpc_values = main  # Use main as check_rpc_values
 except ImportError as e:
     logger.error(f"Failed to import main: {e}")
     try:
-        from ringba_bot_production import check_rpc_values, ensure_packages_installed
+        from ringba_bot_production import check_rpc_values, close_browser
         logger.info("Successfully imported check_rpc_values function")
     except ImportError as e2:
         logger.error(f"Failed to import check_rpc_values: {e2}")
         sys.exit(1)
 
+async def run_once():
+    """Run a single check and shut the shared browser down before the loop closes"""
+    try:
+        await check_rpc_values()
+    finally:
+        await close_browser()
+
 # Run the check immediately without scheduling
 if __name__ == "__main__":
     print("==== Ringba RPC Monitor - Cron Job ====")
     logger.info("Starting Ringba RPC Monitor cron job")
     
     try:
-        # Ensure required packages are installed
-        ensure_packages_installed()
-        
         # Run the check
-        asyncio.run(check_rpc_values())
+        asyncio.run(run_once())
         logger.info("RPC check completed successfully")
         sys.exit(0)
     except Exception as e:
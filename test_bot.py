@@ -5,9 +5,9 @@ Use this to verify your setup before deployment.
 """
 
 import os
+import asyncio
 import logging
 from dotenv import load_dotenv
-import chrome_helper  # Import our custom chrome helper
 
 # Configure logging
 logging.basicConfig(
@@ -16,9 +16,11 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-def test_bot():
+async def test_bot():
     """
     Test the main functionality of the bot
+    
+    Runs the same extraction path as the scheduler: a RingbaWorker browser and a RingbaSession poll.
     """
     logger.info("Starting test run...")
     
@@ -35,23 +37,13 @@ def test_bot():
         return False
     
     # Import these functions only after verifying environment variables
-    from ringba_bot import login_to_ringba, navigate_to_reporting, extract_target_rpc_data, send_slack_notification, RPC_THRESHOLD
+    from ringba_bot import RingbaWorker, send_slack_notification, low_rpc_rows, RPC_THRESHOLD
     
-    driver = None
     try:
-        # Set up WebDriver directly using our chrome_helper
-        logger.info("Setting up WebDriver using chrome_helper...")
-        driver = chrome_helper.get_selenium_webdriver(headless=True)
-        logger.info("WebDriver setup successful")
-        
-        # Login to Ringba
-        login_to_ringba(driver)
-        
-        # Navigate to Reporting tab
-        navigate_to_reporting(driver)
-        
-        # Extract Target and RPC data
-        target_rpc_data = extract_target_rpc_data(driver)
+        # Launch the browser, log in, open Reporting and extract every Target/RPC row
+        logger.info("Launching browser...")
+        async with RingbaWorker() as worker:
+            target_rpc_data = await worker.extract_rows()
         
         # Display extracted data
         logger.info(f"Successfully extracted data for {len(target_rpc_data)} targets")
@@ -59,7 +51,7 @@ def test_bot():
             logger.info(f"Target: {item['Target']}, RPC: ${item['RPC']}")
         
         # Filter for low RPC values
-        low_rpc_data = [item for item in target_rpc_data if item["RPC"] < RPC_THRESHOLD]
+        low_rpc_data = low_rpc_rows(target_rpc_data, RPC_THRESHOLD)
         
         # Show results
         if low_rpc_data:
@@ -69,7 +61,7 @@ def test_bot():
             send_test = input(f"Send test Slack notification for {len(low_rpc_data)} low RPC values? (yes/no): ")
             
             if send_test.lower() == "yes":
-                send_slack_notification(low_rpc_data)
+                send_slack_notification(low_rpc_data, skip_unchanged=False)
                 logger.info("Test notification sent to Slack")
         else:
             logger.info(f"No targets with RPC below ${RPC_THRESHOLD}")
@@ -79,36 +71,13 @@ def test_bot():
         
     except Exception as e:
         logger.error(f"Error during test: {e}")
-        try:
-            # Take a screenshot of the error state
-            if driver:
-                driver.save_screenshot("test_error.png")
-                logger.info("Error screenshot saved as test_error.png")
-        except:
-            pass
         return False
-    
-    finally:
-        # Close the WebDriver
-        if driver:
-            driver.quit()
-            logger.info("WebDriver closed")
 
 if __name__ == "__main__":
     try:
-        logger.info("=== RUNNING CHROME HELPER SETUP ===")
-        # Run the chrome_helper module directly to download ChromeDriver if needed
-        chrome_version = chrome_helper.get_chrome_version()
-        if chrome_version:
-            logger.info(f"Detected Chrome version: {chrome_version}")
-        else:
-            logger.warning("Could not detect Chrome version, will use latest ChromeDriver")
-        
-        chrome_helper.download_chromedriver(chrome_version)
-        logger.info("Chrome helper setup completed")
         logger.info("=== STARTING BOT TEST ===")
         
-        test_bot()
+        asyncio.run(test_bot())
     except KeyboardInterrupt:
         logger.info("Test stopped manually")
     except Exception as e: